@@ -3,143 +3,293 @@ Mitsuba Plugin API generator
 """
 
 import argparse
+import functools
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup, Tag
+from lxml import etree, html
 
 UTILS_BASE = """from __future__ import annotations
 from dataclasses import dataclass, field, fields, is_dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+# Per-class field names (minus ``type``/``id``), filled lazily by ``_field_names``.
+# ``__init_subclass__`` fires before ``@dataclass`` has collected the fields,
+# so the names are resolved on first serialization instead.
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+def _field_names(cls: type) -> Tuple[str, ...]:
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(
+            f.name for f in fields(cls) if f.name not in ("type", "id")
+        )
+    return names
 
-@dataclass
+@dataclass(slots=True)
 class Plugin:
     type: str
     id: Optional[str] = None
     def to_dict(self) -> Dict[str, Any]:
+        try:
+            return self._to_dict()
+        except RecursionError:
+            # too deep (or cyclic) for the recursive path
+            return _serialize_stack(self, _PLUGIN)
+    def _to_dict(self, _s: Any = None) -> Dict[str, Any]:
+        \"\"\"Own entries, with values passed through *_s* (``_serialize`` by default).
+
+        Overrides must pass every value through *_s*: with ``_keep`` they return
+        the unconverted entries that ``_serialize_stack`` expands.
+        \"\"\"
+        if _s is None:
+            _s = _serialize
+        _get = getattr
         out: Dict[str, Any] = {"type": self.type}
         if self.id is not None:
             out["id"] = self.id
-        for f in fields(self):
-            if f.name in ("type", "id"):
-                continue
-            v = getattr(self, f.name)
+        for name in _field_names(type(self)):
+            v = _get(self, name)
             if v is None:
                 continue
             if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
                 for i, item in enumerate(v):
-                    out[f"{f.name}_{i}"] = serialize(item)
+                    out[f"{name}_{i}"] = _s(item)
                 continue
-            out[f.name] = serialize(v)
+            out[name] = _s(v)
         return out
 
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# How a value is serialized, decided once per type by ``_kind``
+_LEAF, _PLUGIN, _CALL_TO_DICT, _TRANSFORM, _DATACLASS, _DICT, _LIST = range(7)
+_KINDS: Dict[type, int] = {t: _LEAF for t in _ATOMIC_TYPES}
+
+def _kind(t: type) -> int:
+    if issubclass(t, Plugin):
+        # subclasses overriding to_dict are taken as-is
+        k = _PLUGIN if t.to_dict is Plugin.to_dict else _CALL_TO_DICT
+    elif issubclass(t, Transform):
+        k = _TRANSFORM
+    elif t.__name__.endswith("Transform4f"):  # already a Mitsuba Transform
+        k = _LEAF
+    elif is_dataclass(t):
+        k = _CALL_TO_DICT if hasattr(t, "to_dict") else _DATACLASS
+    elif issubclass(t, dict):
+        k = _DICT
+    elif issubclass(t, list):
+        k = _LIST
+    else:
+        k = _LEAF
+    _KINDS[t] = k
+    return k
+
 def serialize(obj: Any) -> Any:
-    if isinstance(obj, Transform):
-        return obj.to_mi()
-    # already a Mitsuba Transform?
+    \"\"\"Convert *obj* into the plain structure expected by ``mi.load_dict``.
+
+    Recursive; a scene nested past the recursion limit is redone with an
+    explicit work stack, and a cyclic one raises ``ValueError``.
+    \"\"\"
     try:
-        if obj.__class__.__name__.endswith("Transform4f"):
-            return obj
-    except Exception:
-        pass
-    if is_dataclass(obj):
-        return obj.to_dict() if hasattr(obj, "to_dict") else {
-            k: serialize(getattr(obj, k)) for k in obj.__dataclass_fields__  # type: ignore
-        }
-    if isinstance(obj, dict):
-        return {k: serialize(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [serialize(v) for v in obj]
-    return obj
-
-@dataclass
+        return _serialize(obj)
+    except RecursionError:
+        return _serialize_stack(obj, _kind(type(obj)))
+
+def _serialize(obj: Any) -> Any:
+    k = _KINDS.get(type(obj))
+    if k is None:
+        k = _kind(type(obj))
+    if k == _LEAF:
+        return obj
+    if k == _PLUGIN:
+        return obj._to_dict()
+    if k == _TRANSFORM:
+        return obj.to_mi()
+    if k == _CALL_TO_DICT:
+        return obj.to_dict()
+    _s = _serialize
+    if k == _DICT:
+        return {key: _s(v) for key, v in obj.items()}
+    if k == _LIST:
+        return [_s(v) for v in obj]
+    return {f: _s(getattr(obj, f)) for f in obj.__dataclass_fields__}  # type: ignore
+
+def _keep(v: Any) -> Any:
+    return v
+
+_EXIT = -1  # work item that takes a container off the current path
+
+def _serialize_stack(obj: Any, k: int) -> Any:
+    \"\"\"``_serialize`` with an explicit work stack instead of recursion.
+
+    Items are ``(parent, key, value, kind)``; the result is stored in
+    ``parent[key]``. Containers on the current path are tracked by ``id`` so
+    that a cycle raises ``ValueError``; shared subtrees are expanded per use.
+    \"\"\"
+    kinds = _KINDS
+    root: List[Any] = [obj]
+    stack: List[Tuple[Any, Any, Any, int]] = [(root, 0, obj, k)]
+    pop, push = stack.pop, stack.append
+    path: set = set()
+    while stack:
+        parent, key, v, k = pop()
+        if k == _EXIT:
+            path.discard(key)
+            continue
+        if k == _TRANSFORM:
+            parent[key] = v.to_mi()
+            continue
+        if k == _CALL_TO_DICT:
+            parent[key] = v.to_dict()
+            continue
+        if id(v) in path:
+            raise ValueError(f"cannot serialize cyclic reference to {type(v).__name__}")
+        if k == _PLUGIN:
+            out = v._to_dict(_keep)
+            items = out.items()
+        elif k == _DICT:
+            out = dict(v)
+            items = out.items()
+        elif k == _LIST:
+            out = list(v)
+            items = enumerate(out)
+        else:  # _DATACLASS without to_dict
+            out = {f: getattr(v, f) for f in v.__dataclass_fields__}  # type: ignore
+            items = out.items()
+        # place the copy now; entries that need converting are replaced when popped
+        parent[key] = out
+        path.add(id(v))
+        push((None, id(v), None, _EXIT))
+        for ck, c in items:
+            k = kinds.get(type(c))
+            if k is None:
+                k = _kind(type(c))
+            if k != _LEAF:
+                push((out, ck, c, k))
+    return root[0]
+
+@dataclass(slots=True)
 class RGB(Plugin):
     value: List[float] = field(default_factory=lambda: [1.0, 1.0, 1.0])
     def __init__(self, value: List[float]):
-        super().__init__(type="rgb")
+        Plugin.__init__(self, type="rgb")
         self.value = value
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        d: Dict[str, Any] = {"type": "rgb"}
+        if self.id is not None:
+            d["id"] = self.id
+        if self.value is not None:
+            d["value"] = _s(self.value)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class Ref(Plugin):
     def __init__(self, id: str):
-        super().__init__(type="ref")
+        Plugin.__init__(self, type="ref")
         self.id = id
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        d: Dict[str, Any] = {"type": "ref"}
+        if self.id is not None:
+            d["id"] = self.id
+        return d
+
+# ``mitsuba`` is optional at import time; resolved once on first ``to_mi()``
+_mi: Any = None
+
+def _mitsuba() -> Any:
+    global _mi
+    if _mi is None:
+        import mitsuba
+        _mi = mitsuba
+    return _mi
+
+# Transform steps are tuples ``(op_tag, *args)``; the tag indexes the builder table.
+# Sequence arguments are copied, so editing the caller's lists cannot make a cached result stale.
+_OP_TRANSLATE, _OP_SCALE, _OP_ROTATE, _OP_LOOK_AT, _OP_MATRIX = range(5)
+
+# builders for a single step, indexed by op tag; ``T`` is the Mitsuba transform type
+_TRANSFORM_OPS = (
+    lambda T, s: T().translate([s[1], s[2], s[3]]),
+    lambda T, s: T().scale([s[1], s[2], s[3]]),
+    lambda T, s: T().rotate(axis=[s[1], s[2], s[3]], angle=s[4]),
+    lambda T, s: T().look_at(origin=list(s[1]), target=list(s[2]), up=list(s[3])),
+    lambda T, s: T([list(r) for r in s[1]]),
+)
+
+def _compose(T: Any, steps: List[Tuple[Any, ...]], ops: Tuple[Any, ...]) -> Any:
+    cur = T()
+    for step in steps:
+        cur = ops[step[0]](T, step) @ cur
+    return cur
 
 class Transform:
     \"\"\"Chainable affine transform builder (translate, scale, rotate, look_at).
 
-    Produces a ``mi.ScalarTransform4f``.
+    Produces a ``mi.ScalarTransform4f``. The composed result is cached until
+    the next builder call.
     \"\"\"
-    __slots__ = ("_ops",)
+    __slots__ = ("_ops", "_cached")
     def __init__(self) -> None:
-        self._ops: List[Dict[str, Any]] = []
+        self._ops: List[Tuple[Any, ...]] = []
+        self._cached: Any = None
+    def _push(self, step: Tuple[Any, ...]) -> None:
+        self._ops.append(step)
+        self._cached = None
     def translate(self, x: float, y: float, z: float) -> "Transform":
-        self._ops.append({"op":"translate","value":[x,y,z]}); return self
+        self._push((_OP_TRANSLATE, x, y, z)); return self
     def scale(self, x: float, y: Optional[float] = None, z: Optional[float] = None) -> "Transform":
-        if y is None and z is None: self._ops.append({"op":"scale","value":[x,x,x]})
-        else: self._ops.append({"op":"scale","value":[x,y,z]})
+        if y is None and z is None: self._push((_OP_SCALE, x, x, x))
+        else: self._push((_OP_SCALE, x, y, z))
         return self
     def rotate(self, ax: float, ay: float, az: float, angle: float) -> "Transform":
-        self._ops.append({"op":"rotate","axis":[ax,ay,az],"angle":angle}); return self
+        self._push((_OP_ROTATE, ax, ay, az, angle)); return self
     def look_at(self, origin: List[float], target: List[float], up: List[float] = [0,1,0]) -> "Transform":
-        self._ops.append({"op":"look_at","origin":origin,"target":target,"up":up}); return self
+        self._push((_OP_LOOK_AT, tuple(origin), tuple(target), tuple(up))); return self
     def matrix(self, m4x4: List[List[float]]) -> "Transform":
-        self._ops.append({"op":"matrix","matrix":m4x4}); return self
+        self._push((_OP_MATRIX, tuple(map(tuple, m4x4)))); return self
     def to_mi(self):
-        import mitsuba as mi
-        T = mi.ScalarTransform4f
-        cur = T()
-        for step in self._ops:
-            op = step["op"]
-            if op == "translate": piece = T().translate(step["value"])
-            elif op == "scale": piece = T().scale(step["value"])
-            elif op == "rotate": piece = T().rotate(axis=step["axis"], angle=step["angle"])
-            elif op == "look_at": piece = T().look_at(origin=step["origin"], target=step["target"], up=step["up"])
-            elif op == "matrix": piece = T(step["matrix"])
-            else: continue
-            cur = piece @ cur
-        return cur
+        if self._cached is None:
+            self._cached = _compose(_mitsuba().ScalarTransform4f, self._ops, _TRANSFORM_OPS)
+        return self._cached
 """
 
 UTILS_PROJECTIVE = """
+_OP_PERSPECTIVE, _OP_ORTHOGRAPHIC = range(len(_TRANSFORM_OPS), len(_TRANSFORM_OPS) + 2)
+
+_PROJECTIVE_OPS = _TRANSFORM_OPS + (
+    lambda T, s: T().perspective(fov=s[1], near=s[2], far=s[3]),
+    lambda T, s: T().orthographic(near=s[1], far=s[2]),
+)
+
 class ProjectiveTransform(Transform):
     \"\"\"Chainable projective transform builder (Mitsuba >= 3.7).
 
     Extends :class:`Transform` with ``perspective()`` and ``orthographic()``.
     Produces a ``mi.ScalarProjectiveTransform4f``.
     \"\"\"
-    __slots__ = ("_ops",)
+    __slots__ = ()
     def perspective(self, fov: float, near: float, far: float) -> "ProjectiveTransform":
-        self._ops.append({"op":"perspective","fov":fov,"near":near,"far":far}); return self
+        self._push((_OP_PERSPECTIVE, fov, near, far)); return self
     def orthographic(self, near: float, far: float) -> "ProjectiveTransform":
-        self._ops.append({"op":"orthographic","near":near,"far":far}); return self
+        self._push((_OP_ORTHOGRAPHIC, near, far)); return self
     def to_mi(self):
-        import mitsuba as mi
-        T = mi.ScalarProjectiveTransform4f
-        cur = T()
-        for step in self._ops:
-            op = step["op"]
-            if op == "translate": piece = T().translate(step["value"])
-            elif op == "scale": piece = T().scale(step["value"])
-            elif op == "rotate": piece = T().rotate(axis=step["axis"], angle=step["angle"])
-            elif op == "look_at": piece = T().look_at(origin=step["origin"], target=step["target"], up=step["up"])
-            elif op == "perspective": piece = T().perspective(fov=step["fov"], near=step["near"], far=step["far"])
-            elif op == "orthographic": piece = T().orthographic(near=step["near"], far=step["far"])
-            elif op == "matrix": piece = T(step["matrix"])
-            else: continue
-            cur = piece @ cur
-        return cur
+        if self._cached is None:
+            self._cached = _compose(_mitsuba().ScalarProjectiveTransform4f, self._ops, _PROJECTIVE_OPS)
+        return self._cached
 """
 
 SCENE = """from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Self, Union
-from .utils import Plugin, serialize, Ref
+from itertools import chain
+from typing import Any, Dict, List, Optional, Self, Union
+from .utils import Plugin, Ref, _serialize
 
-@dataclass
+@dataclass(slots=True)
 class Scene(Plugin):
     integrator: Optional[Plugin] = None
     sensors: List[Plugin] = field(default_factory=list)
@@ -155,7 +305,7 @@ class Scene(Plugin):
                  media: Dict[str, Plugin] | None=None,
                  assets: Dict[str, Plugin] | None=None,
                  id: str | None=None):
-        super().__init__(type="scene", id=id)
+        Plugin.__init__(self, type="scene", id=id)
         self.integrator = integrator
         if sensors is None:
             self.sensors = []
@@ -174,18 +324,16 @@ class Scene(Plugin):
         self.assets[plugin.id] = plugin
         return Ref(plugin.id)
 
-    def to_dict(self):
-        d = {"type":"scene"}
-        if self.integrator: d["integrator"] = serialize(self.integrator)
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        d: Dict[str, Any] = {"type":"scene"}
+        if self.integrator: d["integrator"] = _s(self.integrator)
         if len(self.sensors) == 1:
-            d["sensor"] = serialize(self.sensors[0])
+            d["sensor"] = _s(self.sensors[0])
         else:
-            for i, s in enumerate(self.sensors):
-                d[f"sensor_{i}"] = serialize(s)
-        for k,v in self.shapes.items():   d[k] = serialize(v)
-        for k,v in self.emitters.items(): d[k] = serialize(v)
-        for k,v in self.media.items():    d[k] = serialize(v)
-        for k,v in self.assets.items():   d[k] = serialize(v)
+            d |= {f"sensor_{i}": _s(s) for i, s in enumerate(self.sensors)}
+        # one pass over all named children
+        d |= {k: _s(v) for k, v in chain(self.shapes.items(), self.emitters.items(),
+                                         self.media.items(), self.assets.items())}
         if self.id is not None: d["id"]=self.id
         return d
 
@@ -244,36 +392,86 @@ class SceneBuilder:
 """
 
 
-def fetch(url: str) -> BeautifulSoup:
-    r = requests.get(url, timeout=30)
+# XPath queries used by the scraper, compiled once at import
+_XP_SECTIONS = etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' section ')] | //section"
+)
+_XP_HEADING = etree.XPath("(.//h2 | .//h3)[1]")
+_XP_CODE = etree.XPath("(.//code)[1]")
+_XP_TABLES = etree.XPath(".//table")
+_XP_HEAD_CELLS = etree.XPath(".//th")
+_XP_BODY_ROWS = etree.XPath(".//tbody//tr")
+_XP_CELLS = etree.XPath(".//td")
+
+
+_local = threading.local()
+
+
+def _session() -> requests.Session:
+    """Per-thread session, so parallel fetches reuse keep-alive connections."""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = requests.Session()
+    return session
+
+
+@functools.lru_cache(maxsize=None)
+def fetch(url: str) -> html.HtmlElement:
+    """Download and parse *url*; pages are cached for the lifetime of the process."""
+    r = _session().get(url, timeout=30)
     r.raise_for_status()
-    return BeautifulSoup(r.text, "html.parser")
+    # r.text decodes with the HTTP charset; raw bytes would fall back to Latin-1
+    return html.fromstring(r.text)
+
+
+def text_of(el: html.HtmlElement, sep: str = "") -> str:
+    """Whitespace-stripped text nodes of *el*, non-empty ones joined with *sep*."""
+    return sep.join(t for t in (s.strip() for s in el.itertext()) if t)
 
 
 CAT_HREF_RE = re.compile(
     r"(?:/src/)?generated/plugins_[^/]+\.html$|plugins_[^/]+\.html$"
 )
+# anchors whose href matches CAT_HREF_RE, filtered inside lxml (EXSLT re:test)
+_XP_CATEGORY_LINKS = etree.XPath(
+    "//a[re:test(@href, $pattern)]",
+    namespaces={"re": "http://exslt.org/regular-expressions"},
+)
 
 
 def discover_category_pages(overview_url: str) -> Dict[str, str]:
     s = fetch(overview_url)
     cats: Dict[str, str] = {}
-    for a in s.select("a[href]"):
-        href = a.get("href", "")
-        if CAT_HREF_RE.search(href):
-            url = urljoin(overview_url, href)
-            slug = re.sub(r"\.html$", "", href.split("/")[-1]).replace("plugins_", "")
-            name = slug.replace("_", " ").title()
-            cats[name] = url
+    for a in _XP_CATEGORY_LINKS(s, pattern=CAT_HREF_RE.pattern):
+        href = a.get("href")
+        url = urljoin(overview_url, href)
+        slug = re.sub(r"\.html$", "", href.split("/")[-1]).replace("plugins_", "")
+        name = slug.replace("_", " ").title()
+        cats[name] = url
     return cats
 
 
-def section_has_param_table(section: Tag) -> bool:
-    for table in section.select("table"):
-        heads = [th.get_text(strip=True).lower() for th in table.select("th")]
-        if heads and ("parameter" in " ".join(heads) and "type" in " ".join(heads)):
-            return True
-    return False
+def _iter_param_tables(
+    section: html.HtmlElement,
+) -> Iterator[Tuple[html.HtmlElement, int, int, int, int]]:
+    """Yield ``(table, idx_name, idx_type, idx_desc, idx_flags)`` per parameter table."""
+    for table in _XP_TABLES(section):
+        h_lower = [text_of(th).lower() for th in _XP_HEAD_CELLS(table)]
+        if not (
+            any("parameter" in h for h in h_lower) and any("type" in h for h in h_lower)
+        ):
+            continue
+        idx_name = next((i for i, h in enumerate(h_lower) if "parameter" in h), 0)
+        idx_type = next((i for i, h in enumerate(h_lower) if "type" in h), 1)
+        idx_desc = next(
+            (i for i, h in enumerate(h_lower) if "description" in h or "desc" in h), 2
+        )
+        idx_flags = next((i for i, h in enumerate(h_lower) if "flags" in h), -1)
+        yield table, idx_name, idx_type, idx_desc, idx_flags
+
+
+def section_has_param_table(section: html.HtmlElement) -> bool:
+    return next(_iter_param_tables(section), None) is not None
 
 
 def split_names(name: str) -> List[str]:
@@ -281,34 +479,28 @@ def split_names(name: str) -> List[str]:
     return parts if parts else [name]
 
 
-def extract_params(section: Tag) -> List[Dict[str, str]]:
+def extract_params(
+    section: html.HtmlElement,
+    tables: Optional[Iterable[Tuple[html.HtmlElement, int, int, int, int]]] = None,
+) -> List[Dict[str, str]]:
+    """Parameters from the first non-empty parameter table of *section*.
+
+    *tables* may pass in the result of ``_iter_param_tables(section)`` when the
+    caller has already scanned the section.
+    """
     out: List[Dict[str, str]] = []
-    for table in section.select("table"):
-        heads = [th.get_text(strip=True) for th in table.select("th")]
-        h_lower = [h.lower() for h in heads]
-        if not ("parameter" in " ".join(h_lower) and "type" in " ".join(h_lower)):
-            continue
-        idx_name = next((i for i, h in enumerate(h_lower) if "parameter" in h), 0)
-        idx_type = next((i for i, h in enumerate(h_lower) if "type" in h), 1)
-        idx_desc = next(
-            (i for i, h in enumerate(h_lower) if "description" in h or "desc" in h), 2
-        )
-        idx_flags = next((i for i, h in enumerate(h_lower) if "flags" in h), -1)
-        for tr in table.select("tbody tr"):
-            tds = tr.select("td")
+    if tables is None:
+        tables = _iter_param_tables(section)
+    for table, idx_name, idx_type, idx_desc, idx_flags in tables:
+        for tr in _XP_BODY_ROWS(table):
+            tds = _XP_CELLS(tr)
             if not tds:
                 continue
-            raw_name = (
-                tds[idx_name].get_text(" ", strip=True) if idx_name < len(tds) else ""
-            )
-            ptype = (
-                tds[idx_type].get_text(" ", strip=True) if idx_type < len(tds) else ""
-            )
-            desc = (
-                tds[idx_desc].get_text(" ", strip=True) if idx_desc < len(tds) else ""
-            )
+            raw_name = text_of(tds[idx_name], " ") if idx_name < len(tds) else ""
+            ptype = text_of(tds[idx_type], " ") if idx_type < len(tds) else ""
+            desc = text_of(tds[idx_desc], " ") if idx_desc < len(tds) else ""
             flags = (
-                tds[idx_flags].get_text(" ", strip=True)
+                text_of(tds[idx_flags], " ")
                 if (idx_flags != -1 and idx_flags < len(tds))
                 else ""
             )
@@ -328,12 +520,13 @@ def parse_category_page(cat_url: str) -> List[Dict[str, object]]:
         re.sub(r"\.html$", "", cat_url.split("/")[-1]).replace("plugins_", "").lower()
     )
     seen_slugs: set[str] = set()
-    for section in s.select("div.section, section"):
-        h = section.select_one("h2, h3")
-        if not h:
+    for section in _XP_SECTIONS(s):
+        h = next(iter(_XP_HEADING(section)), None)
+        if h is None:
             continue
-        title_text = h.get_text(" ", strip=True)
-        if not section_has_param_table(section):
+        title_text = text_of(h, " ")
+        param_tables = list(_iter_param_tables(section))
+        if not param_tables:
             continue
         # derive slug – prefer the section/heading id (reliable plugin name)
         slug = None
@@ -348,9 +541,9 @@ def parse_category_page(cat_url: str) -> List[Dict[str, object]]:
                     slug = candidate
                     break
         if not slug:
-            code = h.select_one("code.literal, code")
-            if code:
-                slug = code.get_text(strip=True)
+            code = next(iter(_XP_CODE(h)), None)
+            if code is not None:
+                slug = text_of(code)
         if not slug:
             slug = raw_id or title_text.split()[0].strip().lower()
         # Skip non-plugin sections (intro/overview) and duplicates
@@ -362,7 +555,7 @@ def parse_category_page(cat_url: str) -> List[Dict[str, object]]:
             continue
         seen_slugs.add(slug)
 
-        params = extract_params(section)
+        params = extract_params(section, param_tables)
         specs.append(
             {
                 "title": title_text.split("(")[0].strip(),
@@ -395,6 +588,9 @@ TYPE_RULES = [
 
 
 def map_type(text: str) -> str:
+    # Sequential on purpose: rule order is the priority, so "spectrum or float"
+    # maps to float. A single alternation regex would pick the leftmost match in
+    # the text instead, and lookahead-per-rule variants benchmark slower.
     t = (text or "").strip()
     for rx, out in TYPE_RULES:
         if rx.search(t):
@@ -416,27 +612,34 @@ def camel(title: str) -> str:
 HEADER = """from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional, Any, Dict, List, Union
-from .utils import Plugin, RGB, Ref, Transform
+from .utils import Plugin, RGB, Ref, Transform, _serialize
 """
 
 HEADER_PROJECTIVE = """from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional, Any, Dict, List, Union
-from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform
+from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform, _serialize
 """
 
-CLASS_TMPL = """@dataclass
+CLASS_TMPL = """@dataclass(slots=True)
 class {cls}(Plugin):
     \"\"\"{title} ({slug})
     {url}
     Params:
 {param_docs}
     \"\"\"
+    type: str = field(default="{slug}", init=False)
 {fields}
 
-    def __init__(self, {ctor_args}):
-        super().__init__(type="{slug}", id=id)
-{assignments}
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not {cls}:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {{"type": "{slug}"}}
+        if self.id is not None:
+            d["id"] = self.id
+{to_dict_body}
+        return d
 """
 
 
@@ -449,9 +652,7 @@ def render_class(spec: Dict[str, object], category_name: str) -> str:
 
     required_fields = []
     optional_fields = []
-    required_ctor = []
-    optional_ctor = []
-    assigns = ["        self.id = id"]
+    serials = []
     docs = []
     seen = set()
 
@@ -473,6 +674,25 @@ def render_class(spec: Dict[str, object], category_name: str) -> str:
         seen.add(name)
         return name
 
+    def serial(nm: str, ann: str, required: bool) -> List[str]:
+        """Straight-line ``_to_dict`` statements for one field."""
+        if "Plugin" in ann:
+            # a list of plugins needs distinct keys (name_0, name_1, ...)
+            body = [
+                "    if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):",
+                "        for i, item in enumerate(v):",
+                f"            d[f\"{nm}_{{i}}\"] = _s(item)",
+                "    else:",
+                f"        d[\"{nm}\"] = _s(v)",
+            ]
+        else:
+            body = [f"    d[\"{nm}\"] = _s(v)"]
+        if required:
+            body = [ln[4:] for ln in body]
+        else:
+            body = ["if v is not None:"] + body
+        return [f"        v = self.{nm}"] + [f"        {ln}" for ln in body]
+
     for p in params:
         flags = (p.get("flags", "") or "").lower()
         if any(tag in flags for tag in ("state", "derived", "output")):
@@ -498,13 +718,12 @@ def render_class(spec: Dict[str, object], category_name: str) -> str:
                 nm = unique(nm)
 
             if is_required:
-                required_fields.append(f"    {nm}: {ann}")
-                required_ctor.append(f"{nm}: {ann}")
+                # keyword-only so it may follow the inherited ``id`` default
+                required_fields.append(f"    {nm}: {ann} = field(kw_only=True)")
             else:
                 optional_fields.append(f"    {nm}: {ann} = None")
-                optional_ctor.append(f"{nm}: {ann} = None")
 
-            assigns.append(f"        self.{nm} = {nm}")
+            serials += serial(nm, ann, is_required)
 
             markers = []
             if "p" in flags:
@@ -523,25 +742,20 @@ def render_class(spec: Dict[str, object], category_name: str) -> str:
     if add_shape_bsdf and "bsdf" not in seen:
         seen.add("bsdf")
         optional_fields.append(f"    bsdf: Optional[Plugin] = None")
-        optional_ctor.append(f"bsdf: Optional[Plugin] = None")
-        assigns.append(f"        self.bsdf = bsdf")
+        serials += serial("bsdf", "Optional[Plugin]", False)
         docs.append(f"        - bsdf (bsdf): [P] Surface scattering model")
 
     # Inject optional film for sensors if not already present
     if add_sensor_film and "film" not in seen:
         seen.add("film")
         optional_fields.append(f"    film: Optional[Plugin] = None")
-        optional_ctor.append(f"film: Optional[Plugin] = None")
-        assigns.append(f"        self.film = film")
+        serials += serial("film", "Optional[Plugin]", False)
         docs.append(f"        - film (film): Film plugin for the sensor")
 
     fields = required_fields + optional_fields
     if not fields:
-        fields = ["    pass"]
         docs = ["        (no parameters documented)"]
 
-    ctor_args = required_ctor + ["id: Optional[str] = None"] + optional_ctor
-
     return CLASS_TMPL.format(
         cls=cls,
         title=title,
@@ -549,12 +763,12 @@ def render_class(spec: Dict[str, object], category_name: str) -> str:
         url=url,
         param_docs="\n".join(docs),
         fields="\n".join(fields),
-        ctor_args=", ".join(ctor_args),
-        assignments="\n".join(assigns),
+        to_dict_body="\n".join(serials),
     )
 
 
 FALLBACK_VERSION = "3.7.1"
+FETCH_WORKERS = 8
 
 
 def _version_tuple(v: str) -> tuple[int, ...]:
@@ -615,8 +829,10 @@ def generate(out_dir: str, overview_url: str | None = None) -> None:
 
     cats = discover_category_pages(overview_url)
     header = HEADER_PROJECTIVE if has_projective else HEADER
-    for name, url in cats.items():
-        specs = parse_category_page(url)
+    # category pages are independent; fetch and parse them concurrently
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+        pages = list(ex.map(parse_category_page, cats.values()))
+    for name, specs in zip(cats, pages):
         lines = [header, f"# Category: {name}\n"]
         seen_classes: set[str] = set()
         for spec in specs:
@@ -1,25 +1,37 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional, Any, Dict, List, Union
-from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform
+from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform, _serialize
 
 # Category: Bsdfs
 
-@dataclass
+@dataclass(slots=True)
 class SmoothDiffuseMaterial(Plugin):
     """Smooth diffuse material (diffuse)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#diffuse
     Params:
         - reflectance (spectrum or texture): [P | ∂] Specifies the diffuse albedo of the material (Default: 0.5)
     """
+    type: str = field(default="diffuse", init=False)
     reflectance: Optional[Union[List[float], Plugin]] = None
 
-    def __init__(self, id: Optional[str] = None, reflectance: Optional[Union[List[float], Plugin]] = None):
-        super().__init__(type="diffuse", id=id)
-        self.id = id
-        self.reflectance = reflectance
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not SmoothDiffuseMaterial:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "diffuse"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.reflectance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"reflectance_{i}"] = _s(item)
+            else:
+                d["reflectance"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class SmoothDielectricMaterial(Plugin):
     """Smooth dielectric material (dielectric)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#dielectric
@@ -30,22 +42,46 @@ class SmoothDielectricMaterial(Plugin):
         - specular_transmittance (spectrum or texture): [P | ∂] Optional factor that can be used to modulate the specular transmission component. Note that for physical realism, this parameter should never be touched. (Default: 1.0)
         - eta (float): [P] Relative index of refraction from the exterior to the interior
     """
+    type: str = field(default="dielectric", init=False)
     int_ior: Optional[float] = None
     ext_ior: Optional[float] = None
     specular_reflectance: Optional[Union[List[float], Plugin]] = None
     specular_transmittance: Optional[Union[List[float], Plugin]] = None
     eta: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, int_ior: Optional[float] = None, ext_ior: Optional[float] = None, specular_reflectance: Optional[Union[List[float], Plugin]] = None, specular_transmittance: Optional[Union[List[float], Plugin]] = None, eta: Optional[float] = None):
-        super().__init__(type="dielectric", id=id)
-        self.id = id
-        self.int_ior = int_ior
-        self.ext_ior = ext_ior
-        self.specular_reflectance = specular_reflectance
-        self.specular_transmittance = specular_transmittance
-        self.eta = eta
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not SmoothDielectricMaterial:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "dielectric"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.int_ior
+        if v is not None:
+            d["int_ior"] = _s(v)
+        v = self.ext_ior
+        if v is not None:
+            d["ext_ior"] = _s(v)
+        v = self.specular_reflectance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"specular_reflectance_{i}"] = _s(item)
+            else:
+                d["specular_reflectance"] = _s(v)
+        v = self.specular_transmittance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"specular_transmittance_{i}"] = _s(item)
+            else:
+                d["specular_transmittance"] = _s(v)
+        v = self.eta
+        if v is not None:
+            d["eta"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class ThinDielectricMaterial(Plugin):
     """Thin dielectric material (thindielectric)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#thindielectric
@@ -56,22 +92,46 @@ class ThinDielectricMaterial(Plugin):
         - specular_transmittance (spectrum or texture): [P | ∂] Optional factor that can be used to modulate the specular transmission component. Note that for physical realism, this parameter should never be touched. (Default: 1.0)
         - eta (float): [P | ∂ | D] Relative index of refraction from the exterior to the interior
     """
+    type: str = field(default="thindielectric", init=False)
     int_ior: Optional[float] = None
     ext_ior: Optional[float] = None
     specular_reflectance: Optional[Union[List[float], Plugin]] = None
     specular_transmittance: Optional[Union[List[float], Plugin]] = None
     eta: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, int_ior: Optional[float] = None, ext_ior: Optional[float] = None, specular_reflectance: Optional[Union[List[float], Plugin]] = None, specular_transmittance: Optional[Union[List[float], Plugin]] = None, eta: Optional[float] = None):
-        super().__init__(type="thindielectric", id=id)
-        self.id = id
-        self.int_ior = int_ior
-        self.ext_ior = ext_ior
-        self.specular_reflectance = specular_reflectance
-        self.specular_transmittance = specular_transmittance
-        self.eta = eta
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not ThinDielectricMaterial:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "thindielectric"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.int_ior
+        if v is not None:
+            d["int_ior"] = _s(v)
+        v = self.ext_ior
+        if v is not None:
+            d["ext_ior"] = _s(v)
+        v = self.specular_reflectance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"specular_reflectance_{i}"] = _s(item)
+            else:
+                d["specular_reflectance"] = _s(v)
+        v = self.specular_transmittance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"specular_transmittance_{i}"] = _s(item)
+            else:
+                d["specular_transmittance"] = _s(v)
+        v = self.eta
+        if v is not None:
+            d["eta"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class RoughDielectricMaterial(Plugin):
     """Rough dielectric material (roughdielectric)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#roughdielectric
@@ -100,6 +160,7 @@ focuses computation on the visible parts of the microfacet normal distribution,
 reducing variance in some cases. (Default: true , i.e. use visible normal sampling)
         - eta (float): [P | ∂ | D] Relative index of refraction from the exterior to the interior
     """
+    type: str = field(default="roughdielectric", init=False)
     int_ior: Optional[float] = None
     ext_ior: Optional[float] = None
     specular_reflectance: Optional[Union[List[float], Plugin]] = None
@@ -111,21 +172,54 @@ reducing variance in some cases. (Default: true , i.e. use visible normal sampli
     sample_visible: Optional[bool] = None
     eta: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, int_ior: Optional[float] = None, ext_ior: Optional[float] = None, specular_reflectance: Optional[Union[List[float], Plugin]] = None, specular_transmittance: Optional[Union[List[float], Plugin]] = None, distribution: Optional[str] = None, alpha: Optional[float] = None, alpha_u: Optional[float] = None, alpha_v: Optional[float] = None, sample_visible: Optional[bool] = None, eta: Optional[float] = None):
-        super().__init__(type="roughdielectric", id=id)
-        self.id = id
-        self.int_ior = int_ior
-        self.ext_ior = ext_ior
-        self.specular_reflectance = specular_reflectance
-        self.specular_transmittance = specular_transmittance
-        self.distribution = distribution
-        self.alpha = alpha
-        self.alpha_u = alpha_u
-        self.alpha_v = alpha_v
-        self.sample_visible = sample_visible
-        self.eta = eta
-
-@dataclass
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not RoughDielectricMaterial:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "roughdielectric"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.int_ior
+        if v is not None:
+            d["int_ior"] = _s(v)
+        v = self.ext_ior
+        if v is not None:
+            d["ext_ior"] = _s(v)
+        v = self.specular_reflectance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"specular_reflectance_{i}"] = _s(item)
+            else:
+                d["specular_reflectance"] = _s(v)
+        v = self.specular_transmittance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"specular_transmittance_{i}"] = _s(item)
+            else:
+                d["specular_transmittance"] = _s(v)
+        v = self.distribution
+        if v is not None:
+            d["distribution"] = _s(v)
+        v = self.alpha
+        if v is not None:
+            d["alpha"] = _s(v)
+        v = self.alpha_u
+        if v is not None:
+            d["alpha_u"] = _s(v)
+        v = self.alpha_v
+        if v is not None:
+            d["alpha_v"] = _s(v)
+        v = self.sample_visible
+        if v is not None:
+            d["sample_visible"] = _s(v)
+        v = self.eta
+        if v is not None:
+            d["eta"] = _s(v)
+        return d
+
+@dataclass(slots=True)
 class SmoothConductor(Plugin):
     """Smooth conductor (conductor)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#conductor
@@ -136,20 +230,46 @@ class SmoothConductor(Plugin):
         - specular_reflectance (spectrum or texture): [P | ∂] Optional factor that can be used to modulate the specular reflection component.
 Note that for physical realism, this parameter should never be touched. (Default: 1.0)
     """
+    type: str = field(default="conductor", init=False)
     material: Optional[str] = None
     eta: Optional[Union[List[float], Plugin]] = None
     k: Optional[Union[List[float], Plugin]] = None
     specular_reflectance: Optional[Union[List[float], Plugin]] = None
 
-    def __init__(self, id: Optional[str] = None, material: Optional[str] = None, eta: Optional[Union[List[float], Plugin]] = None, k: Optional[Union[List[float], Plugin]] = None, specular_reflectance: Optional[Union[List[float], Plugin]] = None):
-        super().__init__(type="conductor", id=id)
-        self.id = id
-        self.material = material
-        self.eta = eta
-        self.k = k
-        self.specular_reflectance = specular_reflectance
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not SmoothConductor:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "conductor"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.material
+        if v is not None:
+            d["material"] = _s(v)
+        v = self.eta
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"eta_{i}"] = _s(item)
+            else:
+                d["eta"] = _s(v)
+        v = self.k
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"k_{i}"] = _s(item)
+            else:
+                d["k"] = _s(v)
+        v = self.specular_reflectance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"specular_reflectance_{i}"] = _s(item)
+            else:
+                d["specular_reflectance"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class RoughConductorMaterial(Plugin):
     """Rough conductor material (roughconductor)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#roughconductor
@@ -176,6 +296,7 @@ parameter to initialize both alpha_u and alpha_v to the same value. (Default: 0.
 focuses computation on the visible parts of the microfacet normal distribution, considerably
 reducing variance in some cases. (Default: true , i.e. use visible normal sampling)
     """
+    type: str = field(default="roughconductor", init=False)
     material: Optional[str] = None
     eta: Optional[Union[List[float], Plugin]] = None
     k: Optional[Union[List[float], Plugin]] = None
@@ -186,20 +307,55 @@ reducing variance in some cases. (Default: true , i.e. use visible normal sampli
     alpha_v: Optional[float] = None
     sample_visible: Optional[bool] = None
 
-    def __init__(self, id: Optional[str] = None, material: Optional[str] = None, eta: Optional[Union[List[float], Plugin]] = None, k: Optional[Union[List[float], Plugin]] = None, specular_reflectance: Optional[Union[List[float], Plugin]] = None, distribution: Optional[str] = None, alpha: Optional[float] = None, alpha_u: Optional[float] = None, alpha_v: Optional[float] = None, sample_visible: Optional[bool] = None):
-        super().__init__(type="roughconductor", id=id)
-        self.id = id
-        self.material = material
-        self.eta = eta
-        self.k = k
-        self.specular_reflectance = specular_reflectance
-        self.distribution = distribution
-        self.alpha = alpha
-        self.alpha_u = alpha_u
-        self.alpha_v = alpha_v
-        self.sample_visible = sample_visible
-
-@dataclass
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not RoughConductorMaterial:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "roughconductor"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.material
+        if v is not None:
+            d["material"] = _s(v)
+        v = self.eta
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"eta_{i}"] = _s(item)
+            else:
+                d["eta"] = _s(v)
+        v = self.k
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"k_{i}"] = _s(item)
+            else:
+                d["k"] = _s(v)
+        v = self.specular_reflectance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"specular_reflectance_{i}"] = _s(item)
+            else:
+                d["specular_reflectance"] = _s(v)
+        v = self.distribution
+        if v is not None:
+            d["distribution"] = _s(v)
+        v = self.alpha
+        if v is not None:
+            d["alpha"] = _s(v)
+        v = self.alpha_u
+        if v is not None:
+            d["alpha_u"] = _s(v)
+        v = self.alpha_v
+        if v is not None:
+            d["alpha_v"] = _s(v)
+        v = self.sample_visible
+        if v is not None:
+            d["sample_visible"] = _s(v)
+        return d
+
+@dataclass(slots=True)
 class HairMaterial(Plugin):
     """Hair material (hair)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#hair
@@ -222,6 +378,7 @@ angle is given in degrees. (Default: 2)
 absorption coefficient sigma_a
         - eta (float): [P | ∂ | D] Relative index of refraction from the exterior to the interior
     """
+    type: str = field(default="hair", init=False)
     eumelanin: Optional[float] = None
     pheomelanin: Optional[float] = None
     sigma_a: Optional[Union[List[float], Plugin]] = None
@@ -234,36 +391,75 @@ absorption coefficient sigma_a
     use_pigmentation: Optional[bool] = None
     eta: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, eumelanin: Optional[float] = None, pheomelanin: Optional[float] = None, sigma_a: Optional[Union[List[float], Plugin]] = None, scale: Optional[float] = None, int_ior: Optional[float] = None, ext_ior: Optional[float] = None, longitudinal_roughness: Optional[float] = None, azimuthal_roughness: Optional[float] = None, scale_tilt: Optional[float] = None, use_pigmentation: Optional[bool] = None, eta: Optional[float] = None):
-        super().__init__(type="hair", id=id)
-        self.id = id
-        self.eumelanin = eumelanin
-        self.pheomelanin = pheomelanin
-        self.sigma_a = sigma_a
-        self.scale = scale
-        self.int_ior = int_ior
-        self.ext_ior = ext_ior
-        self.longitudinal_roughness = longitudinal_roughness
-        self.azimuthal_roughness = azimuthal_roughness
-        self.scale_tilt = scale_tilt
-        self.use_pigmentation = use_pigmentation
-        self.eta = eta
-
-@dataclass
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not HairMaterial:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "hair"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.eumelanin
+        if v is not None:
+            d["eumelanin"] = _s(v)
+        v = self.pheomelanin
+        if v is not None:
+            d["pheomelanin"] = _s(v)
+        v = self.sigma_a
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"sigma_a_{i}"] = _s(item)
+            else:
+                d["sigma_a"] = _s(v)
+        v = self.scale
+        if v is not None:
+            d["scale"] = _s(v)
+        v = self.int_ior
+        if v is not None:
+            d["int_ior"] = _s(v)
+        v = self.ext_ior
+        if v is not None:
+            d["ext_ior"] = _s(v)
+        v = self.longitudinal_roughness
+        if v is not None:
+            d["longitudinal_roughness"] = _s(v)
+        v = self.azimuthal_roughness
+        if v is not None:
+            d["azimuthal_roughness"] = _s(v)
+        v = self.scale_tilt
+        if v is not None:
+            d["scale_tilt"] = _s(v)
+        v = self.use_pigmentation
+        if v is not None:
+            d["use_pigmentation"] = _s(v)
+        v = self.eta
+        if v is not None:
+            d["eta"] = _s(v)
+        return d
+
+@dataclass(slots=True)
 class MeasuredMaterial(Plugin):
     """Measured material (measured)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#measured
     Params:
         - filename (string):  Filename of the material data file to be loaded
     """
+    type: str = field(default="measured", init=False)
     filename: Optional[str] = None
 
-    def __init__(self, id: Optional[str] = None, filename: Optional[str] = None):
-        super().__init__(type="measured", id=id)
-        self.id = id
-        self.filename = filename
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not MeasuredMaterial:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "measured"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.filename
+        if v is not None:
+            d["filename"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class MeasuredPolarizedMaterial(Plugin):
     """Measured polarized material (measured_polarized)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#measured_polarized
@@ -276,18 +472,30 @@ The valid range is between 450 and 650 nm.
 A value of -1 means the full spectrally-varying pBRDF will be used.
 (Default: -1, i.e. all wavelengths.)
     """
+    type: str = field(default="measured_polarized", init=False)
     filename: Optional[str] = None
     alpha_sample: Optional[float] = None
     wavelength: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, filename: Optional[str] = None, alpha_sample: Optional[float] = None, wavelength: Optional[float] = None):
-        super().__init__(type="measured_polarized", id=id)
-        self.id = id
-        self.filename = filename
-        self.alpha_sample = alpha_sample
-        self.wavelength = wavelength
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not MeasuredPolarizedMaterial:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "measured_polarized"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.filename
+        if v is not None:
+            d["filename"] = _s(v)
+        v = self.alpha_sample
+        if v is not None:
+            d["alpha_sample"] = _s(v)
+        v = self.wavelength
+        if v is not None:
+            d["wavelength"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class SmoothPlasticMaterial(Plugin):
     """Smooth plastic material (plastic)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#plastic
@@ -303,6 +511,7 @@ class SmoothPlasticMaterial(Plugin):
 physical realism, this parameter should never be touched. (Default: 1.0)
         - eta (float): [P] Relative index of refraction from the exterior to the interior
     """
+    type: str = field(default="plastic", init=False)
     diffuse_reflectance: Optional[Union[List[float], Plugin]] = None
     nonlinear: Optional[bool] = None
     int_ior: Optional[float] = None
@@ -310,17 +519,42 @@ physical realism, this parameter should never be touched. (Default: 1.0)
     specular_reflectance: Optional[Union[List[float], Plugin]] = None
     eta: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, diffuse_reflectance: Optional[Union[List[float], Plugin]] = None, nonlinear: Optional[bool] = None, int_ior: Optional[float] = None, ext_ior: Optional[float] = None, specular_reflectance: Optional[Union[List[float], Plugin]] = None, eta: Optional[float] = None):
-        super().__init__(type="plastic", id=id)
-        self.id = id
-        self.diffuse_reflectance = diffuse_reflectance
-        self.nonlinear = nonlinear
-        self.int_ior = int_ior
-        self.ext_ior = ext_ior
-        self.specular_reflectance = specular_reflectance
-        self.eta = eta
-
-@dataclass
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not SmoothPlasticMaterial:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "plastic"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.diffuse_reflectance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"diffuse_reflectance_{i}"] = _s(item)
+            else:
+                d["diffuse_reflectance"] = _s(v)
+        v = self.nonlinear
+        if v is not None:
+            d["nonlinear"] = _s(v)
+        v = self.int_ior
+        if v is not None:
+            d["int_ior"] = _s(v)
+        v = self.ext_ior
+        if v is not None:
+            d["ext_ior"] = _s(v)
+        v = self.specular_reflectance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"specular_reflectance_{i}"] = _s(item)
+            else:
+                d["specular_reflectance"] = _s(v)
+        v = self.eta
+        if v is not None:
+            d["eta"] = _s(v)
+        return d
+
+@dataclass(slots=True)
 class RoughPlasticMaterial(Plugin):
     """Rough plastic material (roughplastic)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#roughplastic
@@ -343,6 +577,7 @@ focuses computation on the visible parts of the microfacet normal distribution,
 reducing variance in some cases. (Default: true , i.e. use visible normal sampling)
         - eta (float): [P | ∂ | D] Relative index of refraction from the exterior to the interior
     """
+    type: str = field(default="roughplastic", init=False)
     diffuse_reflectance: Optional[Union[List[float], Plugin]] = None
     nonlinear: Optional[bool] = None
     int_ior: Optional[float] = None
@@ -353,20 +588,51 @@ reducing variance in some cases. (Default: true , i.e. use visible normal sampli
     sample_visible: Optional[bool] = None
     eta: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, diffuse_reflectance: Optional[Union[List[float], Plugin]] = None, nonlinear: Optional[bool] = None, int_ior: Optional[float] = None, ext_ior: Optional[float] = None, specular_reflectance: Optional[Union[List[float], Plugin]] = None, distribution: Optional[str] = None, alpha: Optional[float] = None, sample_visible: Optional[bool] = None, eta: Optional[float] = None):
-        super().__init__(type="roughplastic", id=id)
-        self.id = id
-        self.diffuse_reflectance = diffuse_reflectance
-        self.nonlinear = nonlinear
-        self.int_ior = int_ior
-        self.ext_ior = ext_ior
-        self.specular_reflectance = specular_reflectance
-        self.distribution = distribution
-        self.alpha = alpha
-        self.sample_visible = sample_visible
-        self.eta = eta
-
-@dataclass
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not RoughPlasticMaterial:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "roughplastic"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.diffuse_reflectance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"diffuse_reflectance_{i}"] = _s(item)
+            else:
+                d["diffuse_reflectance"] = _s(v)
+        v = self.nonlinear
+        if v is not None:
+            d["nonlinear"] = _s(v)
+        v = self.int_ior
+        if v is not None:
+            d["int_ior"] = _s(v)
+        v = self.ext_ior
+        if v is not None:
+            d["ext_ior"] = _s(v)
+        v = self.specular_reflectance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"specular_reflectance_{i}"] = _s(item)
+            else:
+                d["specular_reflectance"] = _s(v)
+        v = self.distribution
+        if v is not None:
+            d["distribution"] = _s(v)
+        v = self.alpha
+        if v is not None:
+            d["alpha"] = _s(v)
+        v = self.sample_visible
+        if v is not None:
+            d["sample_visible"] = _s(v)
+        v = self.eta
+        if v is not None:
+            d["eta"] = _s(v)
+        return d
+
+@dataclass(slots=True)
 class BumpMapBsdfAdapter(Plugin):
     """Bump map BSDF adapter (bumpmap)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#bumpmap
@@ -379,22 +645,46 @@ consistent with the geometric normal. This prevents visual artifacts and is
 achieved by a simply flipping the shading normal, as described in [ SchusslerHHD17 ] . (Default: true)
         - use_shadowing_function (boolean): [P] If enabled, the plugin uses a Microfacet-based shadowing term [ ELS19 ] to smooth out transitions on shadow boundaries. (Default: true)
     """
+    type: str = field(default="bumpmap", init=False)
     texture: Optional[Union[Plugin, List[Plugin]]] = None
     bsdf: Optional[Union[Plugin, List[Plugin]]] = None
     scale: Optional[float] = None
     flip_invalid_normals: Optional[bool] = None
     use_shadowing_function: Optional[bool] = None
 
-    def __init__(self, id: Optional[str] = None, texture: Optional[Union[Plugin, List[Plugin]]] = None, bsdf: Optional[Union[Plugin, List[Plugin]]] = None, scale: Optional[float] = None, flip_invalid_normals: Optional[bool] = None, use_shadowing_function: Optional[bool] = None):
-        super().__init__(type="bumpmap", id=id)
-        self.id = id
-        self.texture = texture
-        self.bsdf = bsdf
-        self.scale = scale
-        self.flip_invalid_normals = flip_invalid_normals
-        self.use_shadowing_function = use_shadowing_function
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not BumpMapBsdfAdapter:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "bumpmap"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.texture
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"texture_{i}"] = _s(item)
+            else:
+                d["texture"] = _s(v)
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        v = self.scale
+        if v is not None:
+            d["scale"] = _s(v)
+        v = self.flip_invalid_normals
+        if v is not None:
+            d["flip_invalid_normals"] = _s(v)
+        v = self.use_shadowing_function
+        if v is not None:
+            d["use_shadowing_function"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class NormalMapBsdf(Plugin):
     """Normal map BSDF (normalmap)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#normalmap
@@ -406,20 +696,42 @@ consistent with the geometric normal. This prevents visual artifacts and is
 achieved by a simply flipping the shading normal, as described in [ SchusslerHHD17 ] . (Default: true)
         - use_shadowing_function (boolean): [P] If enabled, the plugin uses a Microfacet-based shadowing term [ ELS19 ] to smooth out transitions on shadow boundaries. (Default: true)
     """
+    type: str = field(default="normalmap", init=False)
     normalmap: Optional[Plugin] = None
     bsdf: Optional[Union[Plugin, List[Plugin]]] = None
     flip_invalid_normals: Optional[bool] = None
     use_shadowing_function: Optional[bool] = None
 
-    def __init__(self, id: Optional[str] = None, normalmap: Optional[Plugin] = None, bsdf: Optional[Union[Plugin, List[Plugin]]] = None, flip_invalid_normals: Optional[bool] = None, use_shadowing_function: Optional[bool] = None):
-        super().__init__(type="normalmap", id=id)
-        self.id = id
-        self.normalmap = normalmap
-        self.bsdf = bsdf
-        self.flip_invalid_normals = flip_invalid_normals
-        self.use_shadowing_function = use_shadowing_function
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not NormalMapBsdf:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "normalmap"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.normalmap
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"normalmap_{i}"] = _s(item)
+            else:
+                d["normalmap"] = _s(v)
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        v = self.flip_invalid_normals
+        if v is not None:
+            d["flip_invalid_normals"] = _s(v)
+        v = self.use_shadowing_function
+        if v is not None:
+            d["use_shadowing_function"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class BlendedMaterial(Plugin):
     """Blended material (blendbsdf)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#blendbsdf
@@ -429,16 +741,30 @@ one activate the first and second nested BSDF respectively, and in-between value
 accordingly. (Default: 0.5)
         - (Nested plugin) (bsdf): [P | ∂] Two nested BSDF instances that should be mixed according to the specified blending weight
     """
+    type: str = field(default="blendbsdf", init=False)
     weight: Optional[float] = None
     bsdf: Optional[Union[Plugin, List[Plugin]]] = None
 
-    def __init__(self, id: Optional[str] = None, weight: Optional[float] = None, bsdf: Optional[Union[Plugin, List[Plugin]]] = None):
-        super().__init__(type="blendbsdf", id=id)
-        self.id = id
-        self.weight = weight
-        self.bsdf = bsdf
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not BlendedMaterial:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "blendbsdf"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.weight
+        if v is not None:
+            d["weight"] = _s(v)
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class OpacityMask(Plugin):
     """Opacity mask (mask)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#mask
@@ -446,30 +772,60 @@ class OpacityMask(Plugin):
         - opacity (spectrum or texture): [P | ∂ | D] Specifies the opacity (where 1=completely opaque) (Default: 0.5)
         - (Nested plugin) (bsdf): [P | ∂] A base BSDF model that represents the non-transparent portion of the scattering
     """
+    type: str = field(default="mask", init=False)
     opacity: Optional[Union[List[float], Plugin]] = None
     bsdf: Optional[Union[Plugin, List[Plugin]]] = None
 
-    def __init__(self, id: Optional[str] = None, opacity: Optional[Union[List[float], Plugin]] = None, bsdf: Optional[Union[Plugin, List[Plugin]]] = None):
-        super().__init__(type="mask", id=id)
-        self.id = id
-        self.opacity = opacity
-        self.bsdf = bsdf
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not OpacityMask:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "mask"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.opacity
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"opacity_{i}"] = _s(item)
+            else:
+                d["opacity"] = _s(v)
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class TwoSidedBrdfAdapter(Plugin):
     """Two-sided BRDF adapter (twosided)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#twosided
     Params:
         - (Nested plugin) (bsdf): [P | ∂] A nested BRDF that should be turned into a two-sided scattering model. If two BRDFs are specified, they will be placed on the front and back side, respectively
     """
+    type: str = field(default="twosided", init=False)
     bsdf: Optional[Union[Plugin, List[Plugin]]] = None
 
-    def __init__(self, id: Optional[str] = None, bsdf: Optional[Union[Plugin, List[Plugin]]] = None):
-        super().__init__(type="twosided", id=id)
-        self.id = id
-        self.bsdf = bsdf
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not TwoSidedBrdfAdapter:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "twosided"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class LinearPolarizerMaterial(Plugin):
     """Linear polarizer material (polarizer)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#polarizer
@@ -479,18 +835,38 @@ class LinearPolarizerMaterial(Plugin):
         - polarizing (boolean):  Optional flag to disable polarization changes in order to use this as a neutral density filter,
 even in polarized render modes. (Default: true , i.e. act as polarizer)
     """
+    type: str = field(default="polarizer", init=False)
     theta: Optional[Union[List[float], Plugin]] = None
     transmittance: Optional[Union[List[float], Plugin]] = None
     polarizing: Optional[bool] = None
 
-    def __init__(self, id: Optional[str] = None, theta: Optional[Union[List[float], Plugin]] = None, transmittance: Optional[Union[List[float], Plugin]] = None, polarizing: Optional[bool] = None):
-        super().__init__(type="polarizer", id=id)
-        self.id = id
-        self.theta = theta
-        self.transmittance = transmittance
-        self.polarizing = polarizing
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not LinearPolarizerMaterial:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "polarizer"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.theta
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"theta_{i}"] = _s(item)
+            else:
+                d["theta"] = _s(v)
+        v = self.transmittance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"transmittance_{i}"] = _s(item)
+            else:
+                d["transmittance"] = _s(v)
+        v = self.polarizing
+        if v is not None:
+            d["polarizing"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class LinearRetarderMaterial(Plugin):
     """Linear retarder material (retarder)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#retarder
@@ -499,18 +875,42 @@ class LinearRetarderMaterial(Plugin):
         - delta (spectrum or texture): [P | ∂] Specifies the retardance (in degrees) where 360 degrees is equivalent to a full wavelength. (Default: 90.0)
         - transmittance (spectrum or texture): [P | ∂] Optional factor that can be used to modulate the specular transmission. (Default: 1.0)
     """
+    type: str = field(default="retarder", init=False)
     theta: Optional[Union[List[float], Plugin]] = None
     delta: Optional[Union[List[float], Plugin]] = None
     transmittance: Optional[Union[List[float], Plugin]] = None
 
-    def __init__(self, id: Optional[str] = None, theta: Optional[Union[List[float], Plugin]] = None, delta: Optional[Union[List[float], Plugin]] = None, transmittance: Optional[Union[List[float], Plugin]] = None):
-        super().__init__(type="retarder", id=id)
-        self.id = id
-        self.theta = theta
-        self.delta = delta
-        self.transmittance = transmittance
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not LinearRetarderMaterial:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "retarder"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.theta
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"theta_{i}"] = _s(item)
+            else:
+                d["theta"] = _s(v)
+        v = self.delta
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"delta_{i}"] = _s(item)
+            else:
+                d["delta"] = _s(v)
+        v = self.transmittance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"transmittance_{i}"] = _s(item)
+            else:
+                d["transmittance"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class CircularPolarizerMaterial(Plugin):
     """Circular polarizer material (circular)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#circular
@@ -518,16 +918,30 @@ class CircularPolarizerMaterial(Plugin):
         - transmittance (spectrum or texture): [P | ∂] Optional factor that can be used to modulate the specular transmission. (Default: 1.0)
         - left_handed (boolean):  Flag to switch between left and right circular polarization. (Default: false , i.e. right circular polarizer)
     """
+    type: str = field(default="circular", init=False)
     transmittance: Optional[Union[List[float], Plugin]] = None
     left_handed: Optional[bool] = None
 
-    def __init__(self, id: Optional[str] = None, transmittance: Optional[Union[List[float], Plugin]] = None, left_handed: Optional[bool] = None):
-        super().__init__(type="circular", id=id)
-        self.id = id
-        self.transmittance = transmittance
-        self.left_handed = left_handed
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not CircularPolarizerMaterial:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "circular"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.transmittance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"transmittance_{i}"] = _s(item)
+            else:
+                d["transmittance"] = _s(v)
+        v = self.left_handed
+        if v is not None:
+            d["left_handed"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class PolarizedPlasticMaterial(Plugin):
     """Polarized plastic material (pplastic)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#pplastic
@@ -548,6 +962,7 @@ focuses computation on the visible parts of the microfacet normal distribution,
 reducing variance in some cases. (Default: true , i.e. use visible normal sampling)
         - eta (float): [P | ∂ | D] Relative index of refraction from the exterior to the interior
     """
+    type: str = field(default="pplastic", init=False)
     diffuse_reflectance: Optional[Union[List[float], Plugin]] = None
     specular_reflectance: Optional[Union[List[float], Plugin]] = None
     int_ior: Optional[float] = None
@@ -557,19 +972,48 @@ reducing variance in some cases. (Default: true , i.e. use visible normal sampli
     sample_visible: Optional[bool] = None
     eta: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, diffuse_reflectance: Optional[Union[List[float], Plugin]] = None, specular_reflectance: Optional[Union[List[float], Plugin]] = None, int_ior: Optional[float] = None, ext_ior: Optional[float] = None, distribution: Optional[str] = None, alpha: Optional[float] = None, sample_visible: Optional[bool] = None, eta: Optional[float] = None):
-        super().__init__(type="pplastic", id=id)
-        self.id = id
-        self.diffuse_reflectance = diffuse_reflectance
-        self.specular_reflectance = specular_reflectance
-        self.int_ior = int_ior
-        self.ext_ior = ext_ior
-        self.distribution = distribution
-        self.alpha = alpha
-        self.sample_visible = sample_visible
-        self.eta = eta
-
-@dataclass
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not PolarizedPlasticMaterial:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "pplastic"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.diffuse_reflectance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"diffuse_reflectance_{i}"] = _s(item)
+            else:
+                d["diffuse_reflectance"] = _s(v)
+        v = self.specular_reflectance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"specular_reflectance_{i}"] = _s(item)
+            else:
+                d["specular_reflectance"] = _s(v)
+        v = self.int_ior
+        if v is not None:
+            d["int_ior"] = _s(v)
+        v = self.ext_ior
+        if v is not None:
+            d["ext_ior"] = _s(v)
+        v = self.distribution
+        if v is not None:
+            d["distribution"] = _s(v)
+        v = self.alpha
+        if v is not None:
+            d["alpha"] = _s(v)
+        v = self.sample_visible
+        if v is not None:
+            d["sample_visible"] = _s(v)
+        v = self.eta
+        if v is not None:
+            d["eta"] = _s(v)
+        return d
+
+@dataclass(slots=True)
 class TheThinPrincipledBsdf(Plugin):
     """The Thin Principled BSDF (principledthin)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#principledthin
@@ -595,6 +1039,7 @@ transmission) (Default:0.0)
         - specular_transmittance_sampling_rate (float): [P] The rate of the main specular transmission in sampling. (Default: 1.0)
         - diffuse_transmittance_sampling_rate (float): [P] The rate of the cosine hemisphere transmission in sampling. (Default: 1.0)
     """
+    type: str = field(default="principledthin", init=False)
     base_color: Optional[Union[List[float], Plugin]] = None
     roughness: Optional[float] = None
     anisotropic: Optional[float] = None
@@ -610,25 +1055,62 @@ transmission) (Default:0.0)
     specular_transmittance_sampling_rate: Optional[float] = None
     diffuse_transmittance_sampling_rate: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, base_color: Optional[Union[List[float], Plugin]] = None, roughness: Optional[float] = None, anisotropic: Optional[float] = None, spec_trans: Optional[float] = None, eta: Optional[float] = None, spec_tint: Optional[float] = None, sheen: Optional[float] = None, sheen_tint: Optional[float] = None, flatness: Optional[float] = None, diff_trans: Optional[float] = None, diffuse_reflectance_sampling_rate: Optional[float] = None, specular_reflectance_sampling_rate: Optional[float] = None, specular_transmittance_sampling_rate: Optional[float] = None, diffuse_transmittance_sampling_rate: Optional[float] = None):
-        super().__init__(type="principledthin", id=id)
-        self.id = id
-        self.base_color = base_color
-        self.roughness = roughness
-        self.anisotropic = anisotropic
-        self.spec_trans = spec_trans
-        self.eta = eta
-        self.spec_tint = spec_tint
-        self.sheen = sheen
-        self.sheen_tint = sheen_tint
-        self.flatness = flatness
-        self.diff_trans = diff_trans
-        self.diffuse_reflectance_sampling_rate = diffuse_reflectance_sampling_rate
-        self.specular_reflectance_sampling_rate = specular_reflectance_sampling_rate
-        self.specular_transmittance_sampling_rate = specular_transmittance_sampling_rate
-        self.diffuse_transmittance_sampling_rate = diffuse_transmittance_sampling_rate
-
-@dataclass
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not TheThinPrincipledBsdf:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "principledthin"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.base_color
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"base_color_{i}"] = _s(item)
+            else:
+                d["base_color"] = _s(v)
+        v = self.roughness
+        if v is not None:
+            d["roughness"] = _s(v)
+        v = self.anisotropic
+        if v is not None:
+            d["anisotropic"] = _s(v)
+        v = self.spec_trans
+        if v is not None:
+            d["spec_trans"] = _s(v)
+        v = self.eta
+        if v is not None:
+            d["eta"] = _s(v)
+        v = self.spec_tint
+        if v is not None:
+            d["spec_tint"] = _s(v)
+        v = self.sheen
+        if v is not None:
+            d["sheen"] = _s(v)
+        v = self.sheen_tint
+        if v is not None:
+            d["sheen_tint"] = _s(v)
+        v = self.flatness
+        if v is not None:
+            d["flatness"] = _s(v)
+        v = self.diff_trans
+        if v is not None:
+            d["diff_trans"] = _s(v)
+        v = self.diffuse_reflectance_sampling_rate
+        if v is not None:
+            d["diffuse_reflectance_sampling_rate"] = _s(v)
+        v = self.specular_reflectance_sampling_rate
+        if v is not None:
+            d["specular_reflectance_sampling_rate"] = _s(v)
+        v = self.specular_transmittance_sampling_rate
+        if v is not None:
+            d["specular_transmittance_sampling_rate"] = _s(v)
+        v = self.diffuse_transmittance_sampling_rate
+        if v is not None:
+            d["diffuse_transmittance_sampling_rate"] = _s(v)
+        return d
+
+@dataclass(slots=True)
 class ThePrincipledBsdf(Plugin):
     """The Principled BSDF (principled)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_bsdfs.html#principled
@@ -657,6 +1139,7 @@ gets glossier as the parameter increases. (Default:0.0)
         - main_specular_sampling_rate (float): [P] The rate of the main specular lobe in sampling. (Default:1.0)
         - clearcoat_sampling_rate (float): [P] The rate of the secondary specular reflection in sampling. (Default:0.0)
     """
+    type: str = field(default="principled", init=False)
     base_color: Optional[Union[List[float], Plugin]] = None
     roughness: Optional[float] = None
     anisotropic: Optional[float] = None
@@ -674,22 +1157,63 @@ gets glossier as the parameter increases. (Default:0.0)
     main_specular_sampling_rate: Optional[float] = None
     clearcoat_sampling_rate: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, base_color: Optional[Union[List[float], Plugin]] = None, roughness: Optional[float] = None, anisotropic: Optional[float] = None, metallic: Optional[float] = None, spec_trans: Optional[float] = None, eta: Optional[float] = None, specular: Optional[float] = None, spec_tint: Optional[float] = None, sheen: Optional[float] = None, sheen_tint: Optional[float] = None, flatness: Optional[float] = None, clearcoat: Optional[float] = None, clearcoat_gloss: Optional[float] = None, diffuse_reflectance_sampling_rate: Optional[float] = None, main_specular_sampling_rate: Optional[float] = None, clearcoat_sampling_rate: Optional[float] = None):
-        super().__init__(type="principled", id=id)
-        self.id = id
-        self.base_color = base_color
-        self.roughness = roughness
-        self.anisotropic = anisotropic
-        self.metallic = metallic
-        self.spec_trans = spec_trans
-        self.eta = eta
-        self.specular = specular
-        self.spec_tint = spec_tint
-        self.sheen = sheen
-        self.sheen_tint = sheen_tint
-        self.flatness = flatness
-        self.clearcoat = clearcoat
-        self.clearcoat_gloss = clearcoat_gloss
-        self.diffuse_reflectance_sampling_rate = diffuse_reflectance_sampling_rate
-        self.main_specular_sampling_rate = main_specular_sampling_rate
-        self.clearcoat_sampling_rate = clearcoat_sampling_rate
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not ThePrincipledBsdf:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "principled"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.base_color
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"base_color_{i}"] = _s(item)
+            else:
+                d["base_color"] = _s(v)
+        v = self.roughness
+        if v is not None:
+            d["roughness"] = _s(v)
+        v = self.anisotropic
+        if v is not None:
+            d["anisotropic"] = _s(v)
+        v = self.metallic
+        if v is not None:
+            d["metallic"] = _s(v)
+        v = self.spec_trans
+        if v is not None:
+            d["spec_trans"] = _s(v)
+        v = self.eta
+        if v is not None:
+            d["eta"] = _s(v)
+        v = self.specular
+        if v is not None:
+            d["specular"] = _s(v)
+        v = self.spec_tint
+        if v is not None:
+            d["spec_tint"] = _s(v)
+        v = self.sheen
+        if v is not None:
+            d["sheen"] = _s(v)
+        v = self.sheen_tint
+        if v is not None:
+            d["sheen_tint"] = _s(v)
+        v = self.flatness
+        if v is not None:
+            d["flatness"] = _s(v)
+        v = self.clearcoat
+        if v is not None:
+            d["clearcoat"] = _s(v)
+        v = self.clearcoat_gloss
+        if v is not None:
+            d["clearcoat_gloss"] = _s(v)
+        v = self.diffuse_reflectance_sampling_rate
+        if v is not None:
+            d["diffuse_reflectance_sampling_rate"] = _s(v)
+        v = self.main_specular_sampling_rate
+        if v is not None:
+            d["main_specular_sampling_rate"] = _s(v)
+        v = self.clearcoat_sampling_rate
+        if v is not None:
+            d["clearcoat_sampling_rate"] = _s(v)
+        return d
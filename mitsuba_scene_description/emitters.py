@@ -1,25 +1,37 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional, Any, Dict, List, Union
-from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform
+from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform, _serialize
 
 # Category: Emitters
 
-@dataclass
+@dataclass(slots=True)
 class AreaLight(Plugin):
     """Area light (area)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_emitters.html#area
     Params:
         - radiance (spectrum or texture): [P | ∂] Specifies the emitted radiance in units of power per unit area per unit steradian.
     """
+    type: str = field(default="area", init=False)
     radiance: Optional[Union[List[float], Plugin]] = None
 
-    def __init__(self, id: Optional[str] = None, radiance: Optional[Union[List[float], Plugin]] = None):
-        super().__init__(type="area", id=id)
-        self.id = id
-        self.radiance = radiance
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not AreaLight:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "area"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.radiance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"radiance_{i}"] = _s(item)
+            else:
+                d["radiance"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class PointLightSource(Plugin):
     """Point light source (point)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_emitters.html#point
@@ -30,32 +42,64 @@ Note that only one of the parameters to_world and position can be used at a time
         - to_world (transform):  Specifies an optional emitter-to-world transformation.  (Default: none,
 i.e. emitter space = world space)
     """
+    type: str = field(default="point", init=False)
     intensity: Optional[Union[List[float], Plugin]] = None
     position: Optional[Plugin] = None
     to_world: Optional[Transform] = None
 
-    def __init__(self, id: Optional[str] = None, intensity: Optional[Union[List[float], Plugin]] = None, position: Optional[Plugin] = None, to_world: Optional[Transform] = None):
-        super().__init__(type="point", id=id)
-        self.id = id
-        self.intensity = intensity
-        self.position = position
-        self.to_world = to_world
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not PointLightSource:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "point"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.intensity
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"intensity_{i}"] = _s(item)
+            else:
+                d["intensity"] = _s(v)
+        v = self.position
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"position_{i}"] = _s(item)
+            else:
+                d["position"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class ConstantEnvironmentEmitter(Plugin):
     """Constant environment emitter (constant)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_emitters.html#constant
     Params:
         - radiance (spectrum): [P | ∂] Specifies the emitted radiance in units of power per unit area per unit steradian.
     """
+    type: str = field(default="constant", init=False)
     radiance: Optional[Union[List[float], Plugin]] = None
 
-    def __init__(self, id: Optional[str] = None, radiance: Optional[Union[List[float], Plugin]] = None):
-        super().__init__(type="constant", id=id)
-        self.id = id
-        self.radiance = radiance
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not ConstantEnvironmentEmitter:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "constant"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.radiance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"radiance_{i}"] = _s(item)
+            else:
+                d["radiance"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class EnvironmentEmitter(Plugin):
     """Environment emitter (envmap)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_emitters.html#envmap
@@ -71,6 +115,7 @@ will be combined using multiple importance sampling (MIS)? This is
 extremely cheap to do and can slightly reduce variance. (Default: false)
         - data (tensor): [P | ∂ | D] Tensor array containing the radiance-valued data.
     """
+    type: str = field(default="envmap", init=False)
     filename: Optional[str] = None
     bitmap: Optional[Plugin] = None
     scale: Optional[float] = None
@@ -78,17 +123,42 @@ extremely cheap to do and can slightly reduce variance. (Default: false)
     mis_compensation: Optional[bool] = None
     data: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, filename: Optional[str] = None, bitmap: Optional[Plugin] = None, scale: Optional[float] = None, to_world: Optional[Transform] = None, mis_compensation: Optional[bool] = None, data: Optional[Plugin] = None):
-        super().__init__(type="envmap", id=id)
-        self.id = id
-        self.filename = filename
-        self.bitmap = bitmap
-        self.scale = scale
-        self.to_world = to_world
-        self.mis_compensation = mis_compensation
-        self.data = data
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not EnvironmentEmitter:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "envmap"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.filename
+        if v is not None:
+            d["filename"] = _s(v)
+        v = self.bitmap
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bitmap_{i}"] = _s(item)
+            else:
+                d["bitmap"] = _s(v)
+        v = self.scale
+        if v is not None:
+            d["scale"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.mis_compensation
+        if v is not None:
+            d["mis_compensation"] = _s(v)
+        v = self.data
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"data_{i}"] = _s(item)
+            else:
+                d["data"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class SunAndSkyEmitter(Plugin):
     """Sun and sky emitter (sunsky)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_emitters.html#sunsky
@@ -117,6 +187,7 @@ Can be used to turn the sky off (by setting it to 0).
         - sun_aperture (float):  Aperture angle of the sun in degrees (Default: 0.5338, normal sun aperture).
         - to_world (transform): [P] Specifies an optional emitter-to-world transformation.  (Default: none, i.e. emitter space = world space)
     """
+    type: str = field(default="sunsky", init=False)
     turbidity: Optional[float] = None
     albedo: Optional[Union[List[float], Plugin]] = None
     latitude: Optional[float] = None
@@ -134,27 +205,72 @@ Can be used to turn the sky off (by setting it to 0).
     sun_aperture: Optional[float] = None
     to_world: Optional[Transform] = None
 
-    def __init__(self, id: Optional[str] = None, turbidity: Optional[float] = None, albedo: Optional[Union[List[float], Plugin]] = None, latitude: Optional[float] = None, longitude: Optional[float] = None, timezone: Optional[float] = None, year: Optional[int] = None, month: Optional[int] = None, day: Optional[int] = None, hour: Optional[float] = None, minute: Optional[float] = None, second: Optional[float] = None, sun_direction: Optional[Plugin] = None, sun_scale: Optional[float] = None, sky_scale: Optional[float] = None, sun_aperture: Optional[float] = None, to_world: Optional[Transform] = None):
-        super().__init__(type="sunsky", id=id)
-        self.id = id
-        self.turbidity = turbidity
-        self.albedo = albedo
-        self.latitude = latitude
-        self.longitude = longitude
-        self.timezone = timezone
-        self.year = year
-        self.month = month
-        self.day = day
-        self.hour = hour
-        self.minute = minute
-        self.second = second
-        self.sun_direction = sun_direction
-        self.sun_scale = sun_scale
-        self.sky_scale = sky_scale
-        self.sun_aperture = sun_aperture
-        self.to_world = to_world
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not SunAndSkyEmitter:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "sunsky"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.turbidity
+        if v is not None:
+            d["turbidity"] = _s(v)
+        v = self.albedo
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"albedo_{i}"] = _s(item)
+            else:
+                d["albedo"] = _s(v)
+        v = self.latitude
+        if v is not None:
+            d["latitude"] = _s(v)
+        v = self.longitude
+        if v is not None:
+            d["longitude"] = _s(v)
+        v = self.timezone
+        if v is not None:
+            d["timezone"] = _s(v)
+        v = self.year
+        if v is not None:
+            d["year"] = _s(v)
+        v = self.month
+        if v is not None:
+            d["month"] = _s(v)
+        v = self.day
+        if v is not None:
+            d["day"] = _s(v)
+        v = self.hour
+        if v is not None:
+            d["hour"] = _s(v)
+        v = self.minute
+        if v is not None:
+            d["minute"] = _s(v)
+        v = self.second
+        if v is not None:
+            d["second"] = _s(v)
+        v = self.sun_direction
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"sun_direction_{i}"] = _s(item)
+            else:
+                d["sun_direction"] = _s(v)
+        v = self.sun_scale
+        if v is not None:
+            d["sun_scale"] = _s(v)
+        v = self.sky_scale
+        if v is not None:
+            d["sky_scale"] = _s(v)
+        v = self.sun_aperture
+        if v is not None:
+            d["sun_aperture"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class SpotLightSource(Plugin):
     """Spot light source (spot)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_emitters.html#spot
@@ -166,36 +282,72 @@ This cannot be spatially varying (e.g. have bitmap as type).
         - texture (texture): [P | ∂] An optional texture to be projected along the spot light. This must be spatially varying (e.g. have bitmap as type).
         - to_world (transform): [P] Specifies an optional emitter-to-world transformation.  (Default: none, i.e. emitter space = world space)
     """
+    type: str = field(default="spot", init=False)
     intensity: Optional[Union[List[float], Plugin]] = None
     cutoff_angle: Optional[float] = None
     beam_width: Optional[float] = None
     texture: Optional[Plugin] = None
     to_world: Optional[Transform] = None
 
-    def __init__(self, id: Optional[str] = None, intensity: Optional[Union[List[float], Plugin]] = None, cutoff_angle: Optional[float] = None, beam_width: Optional[float] = None, texture: Optional[Plugin] = None, to_world: Optional[Transform] = None):
-        super().__init__(type="spot", id=id)
-        self.id = id
-        self.intensity = intensity
-        self.cutoff_angle = cutoff_angle
-        self.beam_width = beam_width
-        self.texture = texture
-        self.to_world = to_world
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not SpotLightSource:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "spot"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.intensity
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"intensity_{i}"] = _s(item)
+            else:
+                d["intensity"] = _s(v)
+        v = self.cutoff_angle
+        if v is not None:
+            d["cutoff_angle"] = _s(v)
+        v = self.beam_width
+        if v is not None:
+            d["beam_width"] = _s(v)
+        v = self.texture
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"texture_{i}"] = _s(item)
+            else:
+                d["texture"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class DirectionalAreaLight(Plugin):
     """Directional area light (directionalarea)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_emitters.html#directionalarea
     Params:
         - radiance (spectrum): [P | ∂] Specifies the emitted radiance in units of power per unit area per unit steradian.
     """
+    type: str = field(default="directionalarea", init=False)
     radiance: Optional[Union[List[float], Plugin]] = None
 
-    def __init__(self, id: Optional[str] = None, radiance: Optional[Union[List[float], Plugin]] = None):
-        super().__init__(type="directionalarea", id=id)
-        self.id = id
-        self.radiance = radiance
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not DirectionalAreaLight:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "directionalarea"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.radiance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"radiance_{i}"] = _s(item)
+            else:
+                d["radiance"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class DistantDirectionalEmitter(Plugin):
     """Distant directional emitter (directional)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_emitters.html#directional
@@ -207,18 +359,38 @@ direction.
         - direction (vector):  Alternative (and exclusive) to to_world . Direction towards which the
 emitter is radiating in world coordinates.
     """
+    type: str = field(default="directional", init=False)
     irradiance: Optional[Union[List[float], Plugin]] = None
     to_world: Optional[Transform] = None
     direction: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, irradiance: Optional[Union[List[float], Plugin]] = None, to_world: Optional[Transform] = None, direction: Optional[Plugin] = None):
-        super().__init__(type="directional", id=id)
-        self.id = id
-        self.irradiance = irradiance
-        self.to_world = to_world
-        self.direction = direction
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not DistantDirectionalEmitter:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "directional"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.irradiance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"irradiance_{i}"] = _s(item)
+            else:
+                d["irradiance"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.direction
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"direction_{i}"] = _s(item)
+            else:
+                d["direction"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class ProjectionLightSource(Plugin):
     """Projection light source (projector)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_emitters.html#projector
@@ -246,6 +418,7 @@ the image axis, to which it applies. x : fov maps to the x -axis in screen space
 (e.g. x when width < height ) larger : fov maps to the larger dimension
 (e.g. y when width < height ) The default is x .
     """
+    type: str = field(default="projector", init=False)
     irradiance: Optional[Plugin] = None
     scale: Optional[float] = None
     to_world: Optional[Transform] = None
@@ -253,17 +426,38 @@ the image axis, to which it applies. x : fov maps to the x -axis in screen space
     focal_length: Optional[str] = None
     fov_axis: Optional[str] = None
 
-    def __init__(self, id: Optional[str] = None, irradiance: Optional[Plugin] = None, scale: Optional[float] = None, to_world: Optional[Transform] = None, fov: Optional[float] = None, focal_length: Optional[str] = None, fov_axis: Optional[str] = None):
-        super().__init__(type="projector", id=id)
-        self.id = id
-        self.irradiance = irradiance
-        self.scale = scale
-        self.to_world = to_world
-        self.fov = fov
-        self.focal_length = focal_length
-        self.fov_axis = fov_axis
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not ProjectionLightSource:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "projector"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.irradiance
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"irradiance_{i}"] = _s(item)
+            else:
+                d["irradiance"] = _s(v)
+        v = self.scale
+        if v is not None:
+            d["scale"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.fov
+        if v is not None:
+            d["fov"] = _s(v)
+        v = self.focal_length
+        if v is not None:
+            d["focal_length"] = _s(v)
+        v = self.fov_axis
+        if v is not None:
+            d["fov_axis"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class TimedSunAndSkyEmitter(Plugin):
     """Timed sun and sky emitter (timed_sunsky)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_emitters.html#timed_sunsky
@@ -296,6 +490,7 @@ Used to vary sunsky appearance
 Used to vary sunsky appearance
         - to_world (transform): [P] Specifies an optional emitter-to-world transformation.  (Default: none, i.e. emitter space = world space)
     """
+    type: str = field(default="timed_sunsky", init=False)
     turbidity: Optional[float] = None
     albedo: Optional[Union[List[float], Plugin]] = None
     latitude: Optional[float] = None
@@ -316,25 +511,72 @@ Used to vary sunsky appearance
     shutter_close: Optional[float] = None
     to_world: Optional[Transform] = None
 
-    def __init__(self, id: Optional[str] = None, turbidity: Optional[float] = None, albedo: Optional[Union[List[float], Plugin]] = None, latitude: Optional[float] = None, longitude: Optional[float] = None, timezone: Optional[float] = None, window_start_time: Optional[float] = None, window_end_time: Optional[float] = None, start_year: Optional[int] = None, start_month: Optional[int] = None, start_day: Optional[int] = None, end_year: Optional[int] = None, end_month: Optional[int] = None, end_day: Optional[int] = None, sun_scale: Optional[float] = None, sky_scale: Optional[float] = None, sun_aperture: Optional[float] = None, shutter_open: Optional[float] = None, shutter_close: Optional[float] = None, to_world: Optional[Transform] = None):
-        super().__init__(type="timed_sunsky", id=id)
-        self.id = id
-        self.turbidity = turbidity
-        self.albedo = albedo
-        self.latitude = latitude
-        self.longitude = longitude
-        self.timezone = timezone
-        self.window_start_time = window_start_time
-        self.window_end_time = window_end_time
-        self.start_year = start_year
-        self.start_month = start_month
-        self.start_day = start_day
-        self.end_year = end_year
-        self.end_month = end_month
-        self.end_day = end_day
-        self.sun_scale = sun_scale
-        self.sky_scale = sky_scale
-        self.sun_aperture = sun_aperture
-        self.shutter_open = shutter_open
-        self.shutter_close = shutter_close
-        self.to_world = to_world
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not TimedSunAndSkyEmitter:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "timed_sunsky"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.turbidity
+        if v is not None:
+            d["turbidity"] = _s(v)
+        v = self.albedo
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"albedo_{i}"] = _s(item)
+            else:
+                d["albedo"] = _s(v)
+        v = self.latitude
+        if v is not None:
+            d["latitude"] = _s(v)
+        v = self.longitude
+        if v is not None:
+            d["longitude"] = _s(v)
+        v = self.timezone
+        if v is not None:
+            d["timezone"] = _s(v)
+        v = self.window_start_time
+        if v is not None:
+            d["window_start_time"] = _s(v)
+        v = self.window_end_time
+        if v is not None:
+            d["window_end_time"] = _s(v)
+        v = self.start_year
+        if v is not None:
+            d["start_year"] = _s(v)
+        v = self.start_month
+        if v is not None:
+            d["start_month"] = _s(v)
+        v = self.start_day
+        if v is not None:
+            d["start_day"] = _s(v)
+        v = self.end_year
+        if v is not None:
+            d["end_year"] = _s(v)
+        v = self.end_month
+        if v is not None:
+            d["end_month"] = _s(v)
+        v = self.end_day
+        if v is not None:
+            d["end_day"] = _s(v)
+        v = self.sun_scale
+        if v is not None:
+            d["sun_scale"] = _s(v)
+        v = self.sky_scale
+        if v is not None:
+            d["sky_scale"] = _s(v)
+        v = self.sun_aperture
+        if v is not None:
+            d["sun_aperture"] = _s(v)
+        v = self.shutter_open
+        if v is not None:
+            d["shutter_open"] = _s(v)
+        v = self.shutter_close
+        if v is not None:
+            d["shutter_close"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        return d
@@ -1,11 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional, Any, Dict, List, Union
-from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform
+from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform, _serialize
 
 # Category: Films
 
-@dataclass
+@dataclass(slots=True)
 class HighDynamicRangeFilm(Plugin):
     """High dynamic range film (hdrfilm)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_films.html#hdrfilm
@@ -45,6 +45,7 @@ Gaussian filter)
         - crop_size (Vector2u): [P] Size of the sub-rectangle of the output in pixels
         - crop_offset (Point2u): [P] Offset of the sub-rectangle of the output in pixels
     """
+    type: str = field(default="hdrfilm", init=False)
     width: Optional[int] = None
     height: Optional[int] = None
     file_format: Optional[str] = None
@@ -61,26 +62,77 @@ Gaussian filter)
     crop_size: Optional[Plugin] = None
     crop_offset: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, width: Optional[int] = None, height: Optional[int] = None, file_format: Optional[str] = None, pixel_format: Optional[str] = None, component_format: Optional[str] = None, crop_offset_x: Optional[int] = None, crop_offset_y: Optional[int] = None, crop_width: Optional[int] = None, crop_height: Optional[int] = None, sample_border: Optional[bool] = None, compensate: Optional[bool] = None, rfilter: Optional[Union[Plugin, List[Plugin]]] = None, size: Optional[Plugin] = None, crop_size: Optional[Plugin] = None, crop_offset: Optional[Plugin] = None):
-        super().__init__(type="hdrfilm", id=id)
-        self.id = id
-        self.width = width
-        self.height = height
-        self.file_format = file_format
-        self.pixel_format = pixel_format
-        self.component_format = component_format
-        self.crop_offset_x = crop_offset_x
-        self.crop_offset_y = crop_offset_y
-        self.crop_width = crop_width
-        self.crop_height = crop_height
-        self.sample_border = sample_border
-        self.compensate = compensate
-        self.rfilter = rfilter
-        self.size = size
-        self.crop_size = crop_size
-        self.crop_offset = crop_offset
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not HighDynamicRangeFilm:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "hdrfilm"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.width
+        if v is not None:
+            d["width"] = _s(v)
+        v = self.height
+        if v is not None:
+            d["height"] = _s(v)
+        v = self.file_format
+        if v is not None:
+            d["file_format"] = _s(v)
+        v = self.pixel_format
+        if v is not None:
+            d["pixel_format"] = _s(v)
+        v = self.component_format
+        if v is not None:
+            d["component_format"] = _s(v)
+        v = self.crop_offset_x
+        if v is not None:
+            d["crop_offset_x"] = _s(v)
+        v = self.crop_offset_y
+        if v is not None:
+            d["crop_offset_y"] = _s(v)
+        v = self.crop_width
+        if v is not None:
+            d["crop_width"] = _s(v)
+        v = self.crop_height
+        if v is not None:
+            d["crop_height"] = _s(v)
+        v = self.sample_border
+        if v is not None:
+            d["sample_border"] = _s(v)
+        v = self.compensate
+        if v is not None:
+            d["compensate"] = _s(v)
+        v = self.rfilter
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"rfilter_{i}"] = _s(item)
+            else:
+                d["rfilter"] = _s(v)
+        v = self.size
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"size_{i}"] = _s(item)
+            else:
+                d["size"] = _s(v)
+        v = self.crop_size
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"crop_size_{i}"] = _s(item)
+            else:
+                d["crop_size"] = _s(v)
+        v = self.crop_offset
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"crop_offset_{i}"] = _s(item)
+            else:
+                d["crop_offset"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class SpectralFilm(Plugin):
     """Spectral film (specfilm)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_films.html#specfilm
@@ -116,6 +168,7 @@ Gaussian filter)
         - crop_size (Vector2u): [P] Size of the sub-rectangle of the output in pixels
         - crop_offset (Point2u): [P] Offset of the sub-rectangle of the output in pixels
     """
+    type: str = field(default="specfilm", init=False)
     width: Optional[int] = None
     height: Optional[int] = None
     component_format: Optional[str] = None
@@ -131,20 +184,73 @@ Gaussian filter)
     crop_size: Optional[Plugin] = None
     crop_offset: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, width: Optional[int] = None, height: Optional[int] = None, component_format: Optional[str] = None, crop_offset_x: Optional[int] = None, crop_offset_y: Optional[int] = None, crop_width: Optional[int] = None, crop_height: Optional[int] = None, sample_border: Optional[bool] = None, compensate: Optional[bool] = None, rfilter: Optional[Union[Plugin, List[Plugin]]] = None, nested_plugins: Optional[Union[List[float], Plugin]] = None, size: Optional[Plugin] = None, crop_size: Optional[Plugin] = None, crop_offset: Optional[Plugin] = None):
-        super().__init__(type="specfilm", id=id)
-        self.id = id
-        self.width = width
-        self.height = height
-        self.component_format = component_format
-        self.crop_offset_x = crop_offset_x
-        self.crop_offset_y = crop_offset_y
-        self.crop_width = crop_width
-        self.crop_height = crop_height
-        self.sample_border = sample_border
-        self.compensate = compensate
-        self.rfilter = rfilter
-        self.nested_plugins = nested_plugins
-        self.size = size
-        self.crop_size = crop_size
-        self.crop_offset = crop_offset
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not SpectralFilm:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "specfilm"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.width
+        if v is not None:
+            d["width"] = _s(v)
+        v = self.height
+        if v is not None:
+            d["height"] = _s(v)
+        v = self.component_format
+        if v is not None:
+            d["component_format"] = _s(v)
+        v = self.crop_offset_x
+        if v is not None:
+            d["crop_offset_x"] = _s(v)
+        v = self.crop_offset_y
+        if v is not None:
+            d["crop_offset_y"] = _s(v)
+        v = self.crop_width
+        if v is not None:
+            d["crop_width"] = _s(v)
+        v = self.crop_height
+        if v is not None:
+            d["crop_height"] = _s(v)
+        v = self.sample_border
+        if v is not None:
+            d["sample_border"] = _s(v)
+        v = self.compensate
+        if v is not None:
+            d["compensate"] = _s(v)
+        v = self.rfilter
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"rfilter_{i}"] = _s(item)
+            else:
+                d["rfilter"] = _s(v)
+        v = self.nested_plugins
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"nested_plugins_{i}"] = _s(item)
+            else:
+                d["nested_plugins"] = _s(v)
+        v = self.size
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"size_{i}"] = _s(item)
+            else:
+                d["size"] = _s(v)
+        v = self.crop_size
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"crop_size_{i}"] = _s(item)
+            else:
+                d["crop_size"] = _s(v)
+        v = self.crop_offset
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"crop_offset_{i}"] = _s(item)
+            else:
+                d["crop_offset"] = _s(v)
+        return d
@@ -1,11 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional, Any, Dict, List, Union
-from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform
+from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform, _serialize
 
 # Category: Integrators
 
-@dataclass
+@dataclass(slots=True)
 class DirectIlluminationIntegrator(Plugin):
     """Direct illumination integrator (direct)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_integrators.html#direct
@@ -20,20 +20,34 @@ using the BSDF sampling strategies implemented by the scene’s surfaces.
         - hide_emitters (boolean):  Hide directly visible emitters.
 (Default: no, i.e. false )
     """
+    type: str = field(default="direct", init=False)
     shading_samples: Optional[int] = None
     emitter_samples: Optional[int] = None
     bsdf_samples: Optional[int] = None
     hide_emitters: Optional[bool] = None
 
-    def __init__(self, id: Optional[str] = None, shading_samples: Optional[int] = None, emitter_samples: Optional[int] = None, bsdf_samples: Optional[int] = None, hide_emitters: Optional[bool] = None):
-        super().__init__(type="direct", id=id)
-        self.id = id
-        self.shading_samples = shading_samples
-        self.emitter_samples = emitter_samples
-        self.bsdf_samples = bsdf_samples
-        self.hide_emitters = hide_emitters
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not DirectIlluminationIntegrator:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "direct"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.shading_samples
+        if v is not None:
+            d["shading_samples"] = _s(v)
+        v = self.emitter_samples
+        if v is not None:
+            d["emitter_samples"] = _s(v)
+        v = self.bsdf_samples
+        if v is not None:
+            d["bsdf_samples"] = _s(v)
+        v = self.hide_emitters
+        if v is not None:
+            d["hide_emitters"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class PathTracer(Plugin):
     """Path tracer (path)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_integrators.html#path
@@ -48,18 +62,30 @@ the russian roulette path termination criterion. For example, if set to
 visible surfaces. (Default: 5)
         - hide_emitters (boolean):  Hide directly visible emitters. (Default: no, i.e. false )
     """
+    type: str = field(default="path", init=False)
     max_depth: Optional[int] = None
     rr_depth: Optional[int] = None
     hide_emitters: Optional[bool] = None
 
-    def __init__(self, id: Optional[str] = None, max_depth: Optional[int] = None, rr_depth: Optional[int] = None, hide_emitters: Optional[bool] = None):
-        super().__init__(type="path", id=id)
-        self.id = id
-        self.max_depth = max_depth
-        self.rr_depth = rr_depth
-        self.hide_emitters = hide_emitters
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not PathTracer:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "path"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.max_depth
+        if v is not None:
+            d["max_depth"] = _s(v)
+        v = self.rr_depth
+        if v is not None:
+            d["rr_depth"] = _s(v)
+        v = self.hide_emitters
+        if v is not None:
+            d["hide_emitters"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class ArbitraryOutputVariablesIntegrator(Plugin):
     """Arbitrary Output Variables integrator (aov)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_integrators.html#aov
@@ -68,16 +94,30 @@ class ArbitraryOutputVariablesIntegrator(Plugin):
         - (Nested plugin) (integrator):  Sub-integrators (can have more than one) which will be sampled along the AOV integrator. Their
 respective output will be put into distinct images.
     """
+    type: str = field(default="aov", init=False)
     aovs: Optional[str] = None
     integrator: Optional[Union[Plugin, List[Plugin]]] = None
 
-    def __init__(self, id: Optional[str] = None, aovs: Optional[str] = None, integrator: Optional[Union[Plugin, List[Plugin]]] = None):
-        super().__init__(type="aov", id=id)
-        self.id = id
-        self.aovs = aovs
-        self.integrator = integrator
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not ArbitraryOutputVariablesIntegrator:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "aov"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.aovs
+        if v is not None:
+            d["aovs"] = _s(v)
+        v = self.integrator
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"integrator_{i}"] = _s(item)
+            else:
+                d["integrator"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class VolumetricPathTracer(Plugin):
     """Volumetric path tracer (volpath)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_integrators.html#volpath
@@ -87,18 +127,30 @@ to single-bounce (direct-only) illumination, and so on. (Default: -1)
         - rr_depth (integer):  Specifies the minimum path depth, after which the implementation will start to use the russian roulette path termination criterion. (Default: 5)
         - hide_emitters (boolean):  Hide directly visible emitters. (Default: no, i.e. false )
     """
+    type: str = field(default="volpath", init=False)
     max_depth: Optional[int] = None
     rr_depth: Optional[int] = None
     hide_emitters: Optional[bool] = None
 
-    def __init__(self, id: Optional[str] = None, max_depth: Optional[int] = None, rr_depth: Optional[int] = None, hide_emitters: Optional[bool] = None):
-        super().__init__(type="volpath", id=id)
-        self.id = id
-        self.max_depth = max_depth
-        self.rr_depth = rr_depth
-        self.hide_emitters = hide_emitters
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not VolumetricPathTracer:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "volpath"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.max_depth
+        if v is not None:
+            d["max_depth"] = _s(v)
+        v = self.rr_depth
+        if v is not None:
+            d["rr_depth"] = _s(v)
+        v = self.hide_emitters
+        if v is not None:
+            d["hide_emitters"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class VolumetricPathTracerWithSpectralMis(Plugin):
     """Volumetric path tracer with spectral MIS (volpathmis)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_integrators.html#volpathmis
@@ -108,18 +160,30 @@ to single-bounce (direct-only) illumination, and so on. (Default: -1)
         - rr_depth (integer):  Specifies the minimum path depth, after which the implementation will start to use the russian roulette path termination criterion. (Default: 5)
         - hide_emitters (boolean):  Hide directly visible emitters. (Default: no, i.e. false )
     """
+    type: str = field(default="volpathmis", init=False)
     max_depth: Optional[int] = None
     rr_depth: Optional[int] = None
     hide_emitters: Optional[bool] = None
 
-    def __init__(self, id: Optional[str] = None, max_depth: Optional[int] = None, rr_depth: Optional[int] = None, hide_emitters: Optional[bool] = None):
-        super().__init__(type="volpathmis", id=id)
-        self.id = id
-        self.max_depth = max_depth
-        self.rr_depth = rr_depth
-        self.hide_emitters = hide_emitters
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not VolumetricPathTracerWithSpectralMis:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "volpathmis"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.max_depth
+        if v is not None:
+            d["max_depth"] = _s(v)
+        v = self.rr_depth
+        if v is not None:
+            d["rr_depth"] = _s(v)
+        v = self.hide_emitters
+        if v is not None:
+            d["hide_emitters"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class PathReplayBackpropagation(Plugin):
     """Path Replay Backpropagation (prb)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_integrators.html#prb
@@ -134,18 +198,30 @@ the russian roulette path termination criterion. For example, if set to
 visible surfaces. (Default: 5)
         - hide_emitters (boolean):  Hide directly visible emitters. (Default: no, i.e. false )
     """
+    type: str = field(default="prb", init=False)
     max_depth: Optional[int] = None
     rr_depth: Optional[int] = None
     hide_emitters: Optional[bool] = None
 
-    def __init__(self, id: Optional[str] = None, max_depth: Optional[int] = None, rr_depth: Optional[int] = None, hide_emitters: Optional[bool] = None):
-        super().__init__(type="prb", id=id)
-        self.id = id
-        self.max_depth = max_depth
-        self.rr_depth = rr_depth
-        self.hide_emitters = hide_emitters
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not PathReplayBackpropagation:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "prb"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.max_depth
+        if v is not None:
+            d["max_depth"] = _s(v)
+        v = self.rr_depth
+        if v is not None:
+            d["rr_depth"] = _s(v)
+        v = self.hide_emitters
+        if v is not None:
+            d["hide_emitters"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class BasicPathReplayBackpropagation(Plugin):
     """Basic Path Replay Backpropagation (prb_basic)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_integrators.html#prb_basic
@@ -156,16 +232,26 @@ visible light sources. 2 will lead to single-bounce (direct-only)
 illumination, and so on. (Default: 6)
         - hide_emitters (boolean):  Hide directly visible emitters. (Default: no, i.e. false )
     """
+    type: str = field(default="prb_basic", init=False)
     max_depth: Optional[int] = None
     hide_emitters: Optional[bool] = None
 
-    def __init__(self, id: Optional[str] = None, max_depth: Optional[int] = None, hide_emitters: Optional[bool] = None):
-        super().__init__(type="prb_basic", id=id)
-        self.id = id
-        self.max_depth = max_depth
-        self.hide_emitters = hide_emitters
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not BasicPathReplayBackpropagation:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "prb_basic"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.max_depth
+        if v is not None:
+            d["max_depth"] = _s(v)
+        v = self.hide_emitters
+        if v is not None:
+            d["hide_emitters"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class DirectIlluminationProjectiveSampling(Plugin):
     """Direct illumination projective sampling (direct_projective)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_integrators.html#direct_projective
@@ -192,6 +278,7 @@ samples that are used to build the guiding structure. (Default: True)
 A higher number of rounds will use more samples and hence should result
 in a more accurate guiding structure. (Default: 1)
     """
+    type: str = field(default="direct_projective", init=False)
     sppc: Optional[int] = None
     sppp: Optional[int] = None
     sppi: Optional[int] = None
@@ -199,17 +286,34 @@ in a more accurate guiding structure. (Default: 1)
     guiding_proj: Optional[bool] = None
     guiding_rounds: Optional[int] = None
 
-    def __init__(self, id: Optional[str] = None, sppc: Optional[int] = None, sppp: Optional[int] = None, sppi: Optional[int] = None, guiding: Optional[str] = None, guiding_proj: Optional[bool] = None, guiding_rounds: Optional[int] = None):
-        super().__init__(type="direct_projective", id=id)
-        self.id = id
-        self.sppc = sppc
-        self.sppp = sppp
-        self.sppi = sppi
-        self.guiding = guiding
-        self.guiding_proj = guiding_proj
-        self.guiding_rounds = guiding_rounds
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not DirectIlluminationProjectiveSampling:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "direct_projective"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.sppc
+        if v is not None:
+            d["sppc"] = _s(v)
+        v = self.sppp
+        if v is not None:
+            d["sppp"] = _s(v)
+        v = self.sppi
+        if v is not None:
+            d["sppi"] = _s(v)
+        v = self.guiding
+        if v is not None:
+            d["guiding"] = _s(v)
+        v = self.guiding_proj
+        if v is not None:
+            d["guiding_proj"] = _s(v)
+        v = self.guiding_rounds
+        if v is not None:
+            d["guiding_rounds"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class ProjectiveSamplingPathReplayBackpropagation(Plugin):
     """Projective sampling Path Replay Backpropagation (prb_projective)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_integrators.html#prb_projective
@@ -244,6 +348,7 @@ samples that are used to build the guiding structure. (Default: True)
 A higher number of rounds will use more samples and hence should result
 in a more accurate guiding structure. (Default: 1)
     """
+    type: str = field(default="prb_projective", init=False)
     max_depth: Optional[int] = None
     rr_depth: Optional[int] = None
     sppc: Optional[int] = None
@@ -253,19 +358,40 @@ in a more accurate guiding structure. (Default: 1)
     guiding_proj: Optional[bool] = None
     guiding_rounds: Optional[int] = None
 
-    def __init__(self, id: Optional[str] = None, max_depth: Optional[int] = None, rr_depth: Optional[int] = None, sppc: Optional[int] = None, sppp: Optional[int] = None, sppi: Optional[int] = None, guiding: Optional[str] = None, guiding_proj: Optional[bool] = None, guiding_rounds: Optional[int] = None):
-        super().__init__(type="prb_projective", id=id)
-        self.id = id
-        self.max_depth = max_depth
-        self.rr_depth = rr_depth
-        self.sppc = sppc
-        self.sppp = sppp
-        self.sppi = sppi
-        self.guiding = guiding
-        self.guiding_proj = guiding_proj
-        self.guiding_rounds = guiding_rounds
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not ProjectiveSamplingPathReplayBackpropagation:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "prb_projective"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.max_depth
+        if v is not None:
+            d["max_depth"] = _s(v)
+        v = self.rr_depth
+        if v is not None:
+            d["rr_depth"] = _s(v)
+        v = self.sppc
+        if v is not None:
+            d["sppc"] = _s(v)
+        v = self.sppp
+        if v is not None:
+            d["sppp"] = _s(v)
+        v = self.sppi
+        if v is not None:
+            d["sppi"] = _s(v)
+        v = self.guiding
+        if v is not None:
+            d["guiding"] = _s(v)
+        v = self.guiding_proj
+        if v is not None:
+            d["guiding_proj"] = _s(v)
+        v = self.guiding_rounds
+        if v is not None:
+            d["guiding_rounds"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class PathReplayBackpropagationVolumetricIntegrator(Plugin):
     """Path Replay Backpropagation Volumetric Integrator (prbvolpath)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_integrators.html#prbvolpath
@@ -280,18 +406,30 @@ the russian roulette path termination criterion. For example, if set to
 visible surfaces. (Default: 5)
         - hide_emitters (boolean):  Hide directly visible emitters. (Default: no, i.e. false )
     """
+    type: str = field(default="prbvolpath", init=False)
     max_depth: Optional[int] = None
     rr_depth: Optional[int] = None
     hide_emitters: Optional[bool] = None
 
-    def __init__(self, id: Optional[str] = None, max_depth: Optional[int] = None, rr_depth: Optional[int] = None, hide_emitters: Optional[bool] = None):
-        super().__init__(type="prbvolpath", id=id)
-        self.id = id
-        self.max_depth = max_depth
-        self.rr_depth = rr_depth
-        self.hide_emitters = hide_emitters
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not PathReplayBackpropagationVolumetricIntegrator:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "prbvolpath"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.max_depth
+        if v is not None:
+            d["max_depth"] = _s(v)
+        v = self.rr_depth
+        if v is not None:
+            d["rr_depth"] = _s(v)
+        v = self.hide_emitters
+        if v is not None:
+            d["hide_emitters"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class MomentIntegrator(Plugin):
     """Moment integrator (moment)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_integrators.html#moment
@@ -299,14 +437,26 @@ class MomentIntegrator(Plugin):
         - (Nested plugin) (integrator):  Sub-integrators (can have more than one) which will be sampled along the AOV integrator. Their
 respective XYZ output will be put into distinct images.
     """
+    type: str = field(default="moment", init=False)
     integrator: Optional[Union[Plugin, List[Plugin]]] = None
 
-    def __init__(self, id: Optional[str] = None, integrator: Optional[Union[Plugin, List[Plugin]]] = None):
-        super().__init__(type="moment", id=id)
-        self.id = id
-        self.integrator = integrator
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not MomentIntegrator:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "moment"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.integrator
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"integrator_{i}"] = _s(item)
+            else:
+                d["integrator"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class StokesVectorIntegrator(Plugin):
     """Stokes vector integrator (stokes)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_integrators.html#stokes
@@ -315,14 +465,26 @@ class StokesVectorIntegrator(Plugin):
 integrator. In polarized rendering modes, its output Stokes vector is written
 into distinct images.
     """
+    type: str = field(default="stokes", init=False)
     integrator: Optional[Union[Plugin, List[Plugin]]] = None
 
-    def __init__(self, id: Optional[str] = None, integrator: Optional[Union[Plugin, List[Plugin]]] = None):
-        super().__init__(type="stokes", id=id)
-        self.id = id
-        self.integrator = integrator
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not StokesVectorIntegrator:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "stokes"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.integrator
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"integrator_{i}"] = _s(item)
+            else:
+                d["integrator"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class ParticleTracer(Plugin):
     """Particle tracer (ptracer)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_integrators.html#ptracer
@@ -333,15 +495,29 @@ to single-bounce (direct-only) illumination, and so on. (Default: -1)
         - hide_emitters (boolean):  Hide directly visible emitters. (Default: no, i.e. false )
         - samples_per_pass (boolean):  If specified, divides the workload in successive passes with samples_per_pass samples per pixel.
     """
+    type: str = field(default="ptracer", init=False)
     max_depth: Optional[int] = None
     rr_depth: Optional[int] = None
     hide_emitters: Optional[bool] = None
     samples_per_pass: Optional[bool] = None
 
-    def __init__(self, id: Optional[str] = None, max_depth: Optional[int] = None, rr_depth: Optional[int] = None, hide_emitters: Optional[bool] = None, samples_per_pass: Optional[bool] = None):
-        super().__init__(type="ptracer", id=id)
-        self.id = id
-        self.max_depth = max_depth
-        self.rr_depth = rr_depth
-        self.hide_emitters = hide_emitters
-        self.samples_per_pass = samples_per_pass
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not ParticleTracer:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "ptracer"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.max_depth
+        if v is not None:
+            d["max_depth"] = _s(v)
+        v = self.rr_depth
+        if v is not None:
+            d["rr_depth"] = _s(v)
+        v = self.hide_emitters
+        if v is not None:
+            d["hide_emitters"] = _s(v)
+        v = self.samples_per_pass
+        if v is not None:
+            d["samples_per_pass"] = _s(v)
+        return d
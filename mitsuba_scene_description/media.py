@@ -1,11 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional, Any, Dict, List, Union
-from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform
+from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform, _serialize
 
 # Category: Media
 
-@dataclass
+@dataclass(slots=True)
 class HomogeneousMedium(Plugin):
     """Homogeneous medium (homogeneous)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_media.html#homogeneous
@@ -24,22 +24,42 @@ with subsurface scattering.
 the medium. When none is specified, the renderer will automatically use an instance of
 isotropic.
     """
+    type: str = field(default="homogeneous", init=False)
     albedo: Optional[float] = None
     sigma_t: Optional[float] = None
     scale: Optional[float] = None
     sample_emitters: Optional[bool] = None
     phase: Optional[Union[Plugin, List[Plugin]]] = None
 
-    def __init__(self, id: Optional[str] = None, albedo: Optional[float] = None, sigma_t: Optional[float] = None, scale: Optional[float] = None, sample_emitters: Optional[bool] = None, phase: Optional[Union[Plugin, List[Plugin]]] = None):
-        super().__init__(type="homogeneous", id=id)
-        self.id = id
-        self.albedo = albedo
-        self.sigma_t = sigma_t
-        self.scale = scale
-        self.sample_emitters = sample_emitters
-        self.phase = phase
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not HomogeneousMedium:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "homogeneous"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.albedo
+        if v is not None:
+            d["albedo"] = _s(v)
+        v = self.sigma_t
+        if v is not None:
+            d["sigma_t"] = _s(v)
+        v = self.scale
+        if v is not None:
+            d["scale"] = _s(v)
+        v = self.sample_emitters
+        if v is not None:
+            d["sample_emitters"] = _s(v)
+        v = self.phase
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"phase_{i}"] = _s(item)
+            else:
+                d["phase"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class HeterogeneousMedium(Plugin):
     """Heterogeneous medium (heterogeneous)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_media.html#heterogeneous
@@ -58,17 +78,37 @@ with subsurface scattering.
 the medium. When none is specified, the renderer will automatically use an instance of
 isotropic.
     """
+    type: str = field(default="heterogeneous", init=False)
     albedo: Optional[float] = None
     sigma_t: Optional[float] = None
     scale: Optional[float] = None
     sample_emitters: Optional[bool] = None
     phase: Optional[Union[Plugin, List[Plugin]]] = None
 
-    def __init__(self, id: Optional[str] = None, albedo: Optional[float] = None, sigma_t: Optional[float] = None, scale: Optional[float] = None, sample_emitters: Optional[bool] = None, phase: Optional[Union[Plugin, List[Plugin]]] = None):
-        super().__init__(type="heterogeneous", id=id)
-        self.id = id
-        self.albedo = albedo
-        self.sigma_t = sigma_t
-        self.scale = scale
-        self.sample_emitters = sample_emitters
-        self.phase = phase
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not HeterogeneousMedium:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "heterogeneous"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.albedo
+        if v is not None:
+            d["albedo"] = _s(v)
+        v = self.sigma_t
+        if v is not None:
+            d["sigma_t"] = _s(v)
+        v = self.scale
+        if v is not None:
+            d["scale"] = _s(v)
+        v = self.sample_emitters
+        if v is not None:
+            d["sample_emitters"] = _s(v)
+        v = self.phase
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"phase_{i}"] = _s(item)
+            else:
+                d["phase"] = _s(v)
+        return d
@@ -1,11 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional, Any, Dict, List, Union
-from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform
+from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform, _serialize
 
 # Category: Phase
 
-@dataclass
+@dataclass(slots=True)
 class IsotropicPhaseFunction(Plugin):
     """Isotropic phase function (isotropic)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_phase.html#isotropic
@@ -17,14 +17,22 @@ predominantly scatter incident light into a similar direction (i.e. the
 medium is forward-scattering ), whereas values smaller than zero cause
 the medium to be scatter more light in the opposite direction.
     """
+    type: str = field(default="isotropic", init=False)
     g: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, g: Optional[float] = None):
-        super().__init__(type="isotropic", id=id)
-        self.id = id
-        self.g = g
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not IsotropicPhaseFunction:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "isotropic"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.g
+        if v is not None:
+            d["g"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class HenyeyGreensteinPhaseFunction(Plugin):
     """Henyey-Greenstein phase function (hg)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_phase.html#hg
@@ -36,14 +44,22 @@ predominantly scatter incident light into a similar direction (i.e. the
 medium is forward-scattering ), whereas values smaller than zero cause
 the medium to be scatter more light in the opposite direction.
     """
+    type: str = field(default="hg", init=False)
     g: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, g: Optional[float] = None):
-        super().__init__(type="hg", id=id)
-        self.id = id
-        self.g = g
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not HenyeyGreensteinPhaseFunction:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "hg"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.g
+        if v is not None:
+            d["g"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class SggxPhaseFunction(Plugin):
     """SGGX phase function (sggx)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_phase.html#sggx
@@ -51,14 +67,26 @@ class SggxPhaseFunction(Plugin):
         - S (volume): [P | ∂] A volume containing the SGGX parameters. The phase function is parametrized
 by six values \\(S_{xx}\\) , \\(S_{yy}\\) , \\(S_{zz}\\) , \\(S_{xy}\\) , \\(S_{xz}\\) and \\(S_{yz}\\) (see below for their meaning). The parameters can either be specified as a constvolume with six values or as a gridvolume with six channels.
     """
+    type: str = field(default="sggx", init=False)
     s: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, s: Optional[Plugin] = None):
-        super().__init__(type="sggx", id=id)
-        self.id = id
-        self.s = s
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not SggxPhaseFunction:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "sggx"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.s
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"s_{i}"] = _s(item)
+            else:
+                d["s"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class BlendedPhaseFunction(Plugin):
     """Blended phase function (blendphase)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_phase.html#blendphase
@@ -70,16 +98,30 @@ function respectively, and in-between values interpolate accordingly.
         - (Nested plugin) (phase): [P | ∂] Two nested phase function instances that should be mixed according to the
 specified blending weight
     """
+    type: str = field(default="blendphase", init=False)
     weight: Optional[float] = None
     phase: Optional[Union[Plugin, List[Plugin]]] = None
 
-    def __init__(self, id: Optional[str] = None, weight: Optional[float] = None, phase: Optional[Union[Plugin, List[Plugin]]] = None):
-        super().__init__(type="blendphase", id=id)
-        self.id = id
-        self.weight = weight
-        self.phase = phase
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not BlendedPhaseFunction:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "blendphase"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.weight
+        if v is not None:
+            d["weight"] = _s(v)
+        v = self.phase
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"phase_{i}"] = _s(item)
+            else:
+                d["phase"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class LookupTablePhaseFunction(Plugin):
     """Lookup table phase function (tabphase)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_phase.html#tabphase
@@ -87,9 +129,17 @@ class LookupTablePhaseFunction(Plugin):
         - values (string): [P | ∂ | D] A comma-separated list of phase function values parametrized by the
 cosine of the scattering angle.
     """
+    type: str = field(default="tabphase", init=False)
     values: Optional[str] = None
 
-    def __init__(self, id: Optional[str] = None, values: Optional[str] = None):
-        super().__init__(type="tabphase", id=id)
-        self.id = id
-        self.values = values
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not LookupTablePhaseFunction:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "tabphase"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.values
+        if v is not None:
+            d["values"] = _s(v)
+        return d
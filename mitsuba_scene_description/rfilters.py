@@ -1,53 +1,77 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional, Any, Dict, List, Union
-from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform
+from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform, _serialize
 
 # Category: Rfilters
 
-@dataclass
+@dataclass(slots=True)
 class BoxFilter(Plugin):
     """Box filter (box)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_rfilters.html#box
     Params:
         - radius (float):  Specifies the radius of the tent function (Default: 1.0)
     """
+    type: str = field(default="box", init=False)
     radius: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, radius: Optional[float] = None):
-        super().__init__(type="box", id=id)
-        self.id = id
-        self.radius = radius
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not BoxFilter:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "box"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.radius
+        if v is not None:
+            d["radius"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class TentFilter(Plugin):
     """Tent filter (tent)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_rfilters.html#tent
     Params:
         - radius (float):  Specifies the radius of the tent function (Default: 1.0)
     """
+    type: str = field(default="tent", init=False)
     radius: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, radius: Optional[float] = None):
-        super().__init__(type="tent", id=id)
-        self.id = id
-        self.radius = radius
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not TentFilter:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "tent"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.radius
+        if v is not None:
+            d["radius"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class GaussianFilter(Plugin):
     """Gaussian filter (gaussian)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_rfilters.html#gaussian
     Params:
         - stddev (float):  Specifies the standard deviation (Default: 0.5)
     """
+    type: str = field(default="gaussian", init=False)
     stddev: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, stddev: Optional[float] = None):
-        super().__init__(type="gaussian", id=id)
-        self.id = id
-        self.stddev = stddev
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not GaussianFilter:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "gaussian"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.stddev
+        if v is not None:
+            d["stddev"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class MitchellFilter(Plugin):
     """Mitchell filter (mitchell)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_rfilters.html#mitchell
@@ -55,16 +79,26 @@ class MitchellFilter(Plugin):
         - A (float):  A parameter in the original paper (Default: \\(1/3\\) )
         - B (float):  B parameter in the original paper (Default: \\(1/3\\) )
     """
+    type: str = field(default="mitchell", init=False)
     a: Optional[float] = None
     b: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, a: Optional[float] = None, b: Optional[float] = None):
-        super().__init__(type="mitchell", id=id)
-        self.id = id
-        self.a = a
-        self.b = b
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not MitchellFilter:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "mitchell"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.a
+        if v is not None:
+            d["a"] = _s(v)
+        v = self.b
+        if v is not None:
+            d["b"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class LanczosFilter(Plugin):
     """Lanczos filter (lanczos)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_rfilters.html#lanczos
@@ -73,9 +107,17 @@ class LanczosFilter(Plugin):
 filter will approximate an optimal low-pass filter, but this also increases
 ringing. Values of 2 or 3 are common (Default: 3)
     """
+    type: str = field(default="lanczos", init=False)
     lobes: Optional[int] = None
 
-    def __init__(self, id: Optional[str] = None, lobes: Optional[int] = None):
-        super().__init__(type="lanczos", id=id)
-        self.id = id
-        self.lobes = lobes
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not LanczosFilter:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "lanczos"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.lobes
+        if v is not None:
+            d["lobes"] = _s(v)
+        return d
@@ -1,11 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional, Any, Dict, List, Union
-from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform
+from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform, _serialize
 
 # Category: Samplers
 
-@dataclass
+@dataclass(slots=True)
 class IndependentSampler(Plugin):
     """Independent sampler (independent)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_samplers.html#independent
@@ -13,16 +13,26 @@ class IndependentSampler(Plugin):
         - sample_count (integer):  Number of samples per pixel (Default: 4)
         - seed (integer):  Seed offset (Default: 0)
     """
+    type: str = field(default="independent", init=False)
     sample_count: Optional[int] = None
     seed: Optional[int] = None
 
-    def __init__(self, id: Optional[str] = None, sample_count: Optional[int] = None, seed: Optional[int] = None):
-        super().__init__(type="independent", id=id)
-        self.id = id
-        self.sample_count = sample_count
-        self.seed = seed
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not IndependentSampler:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "independent"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.sample_count
+        if v is not None:
+            d["sample_count"] = _s(v)
+        v = self.seed
+        if v is not None:
+            d["seed"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class StratifiedSampler(Plugin):
     """Stratified sampler (stratified)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_samplers.html#stratified
@@ -31,18 +41,30 @@ class StratifiedSampler(Plugin):
         - seed (integer):  Seed offset (Default: 0)
         - jitter (boolean):  Adds additional random jitter withing the stratum (Default: True)
     """
+    type: str = field(default="stratified", init=False)
     sample_count: Optional[int] = None
     seed: Optional[int] = None
     jitter: Optional[bool] = None
 
-    def __init__(self, id: Optional[str] = None, sample_count: Optional[int] = None, seed: Optional[int] = None, jitter: Optional[bool] = None):
-        super().__init__(type="stratified", id=id)
-        self.id = id
-        self.sample_count = sample_count
-        self.seed = seed
-        self.jitter = jitter
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not StratifiedSampler:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "stratified"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.sample_count
+        if v is not None:
+            d["sample_count"] = _s(v)
+        v = self.seed
+        if v is not None:
+            d["seed"] = _s(v)
+        v = self.jitter
+        if v is not None:
+            d["jitter"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class CorrelatedMultiJitteredSampler(Plugin):
     """Correlated Multi-Jittered sampler (multijitter)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_samplers.html#multijitter
@@ -52,18 +74,30 @@ value to create a subdivision into strata that has an aspect ratio close to one.
         - seed (integer):  Seed offset (Default: 0)
         - jitter (boolean):  Adds additional random jitter withing the substratum (Default: True)
     """
+    type: str = field(default="multijitter", init=False)
     sample_count: Optional[int] = None
     seed: Optional[int] = None
     jitter: Optional[bool] = None
 
-    def __init__(self, id: Optional[str] = None, sample_count: Optional[int] = None, seed: Optional[int] = None, jitter: Optional[bool] = None):
-        super().__init__(type="multijitter", id=id)
-        self.id = id
-        self.sample_count = sample_count
-        self.seed = seed
-        self.jitter = jitter
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not CorrelatedMultiJitteredSampler:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "multijitter"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.sample_count
+        if v is not None:
+            d["sample_count"] = _s(v)
+        v = self.seed
+        if v is not None:
+            d["seed"] = _s(v)
+        v = self.jitter
+        if v is not None:
+            d["jitter"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class OrthogonalArraySampler(Plugin):
     """Orthogonal Array sampler (orthogonal)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_samplers.html#orthogonal
@@ -73,15 +107,29 @@ class OrthogonalArraySampler(Plugin):
         - seed (integer):  Seed offset (Default: 0)
         - jitter (boolean):  Adds additional random jitter withing the substratum (Default: True)
     """
+    type: str = field(default="orthogonal", init=False)
     sample_count: Optional[int] = None
     strength: Optional[int] = None
     seed: Optional[int] = None
     jitter: Optional[bool] = None
 
-    def __init__(self, id: Optional[str] = None, sample_count: Optional[int] = None, strength: Optional[int] = None, seed: Optional[int] = None, jitter: Optional[bool] = None):
-        super().__init__(type="orthogonal", id=id)
-        self.id = id
-        self.sample_count = sample_count
-        self.strength = strength
-        self.seed = seed
-        self.jitter = jitter
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not OrthogonalArraySampler:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "orthogonal"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.sample_count
+        if v is not None:
+            d["sample_count"] = _s(v)
+        v = self.strength
+        if v is not None:
+            d["strength"] = _s(v)
+        v = self.seed
+        if v is not None:
+            d["seed"] = _s(v)
+        v = self.jitter
+        if v is not None:
+            d["jitter"] = _s(v)
+        return d
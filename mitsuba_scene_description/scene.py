@@ -1,9 +1,10 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Self, Union
-from .utils import Plugin, serialize, Ref
+from itertools import chain
+from typing import Any, Dict, List, Optional, Self, Union
+from .utils import Plugin, Ref, _serialize
 
-@dataclass
+@dataclass(slots=True)
 class Scene(Plugin):
     integrator: Optional[Plugin] = None
     sensors: List[Plugin] = field(default_factory=list)
@@ -19,7 +20,7 @@ class Scene(Plugin):
                  media: Dict[str, Plugin] | None=None,
                  assets: Dict[str, Plugin] | None=None,
                  id: str | None=None):
-        super().__init__(type="scene", id=id)
+        Plugin.__init__(self, type="scene", id=id)
         self.integrator = integrator
         if sensors is None:
             self.sensors = []
@@ -38,18 +39,16 @@ class Scene(Plugin):
         self.assets[plugin.id] = plugin
         return Ref(plugin.id)
 
-    def to_dict(self):
-        d = {"type":"scene"}
-        if self.integrator: d["integrator"] = serialize(self.integrator)
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        d: Dict[str, Any] = {"type":"scene"}
+        if self.integrator: d["integrator"] = _s(self.integrator)
         if len(self.sensors) == 1:
-            d["sensor"] = serialize(self.sensors[0])
+            d["sensor"] = _s(self.sensors[0])
         else:
-            for i, s in enumerate(self.sensors):
-                d[f"sensor_{i}"] = serialize(s)
-        for k,v in self.shapes.items():   d[k] = serialize(v)
-        for k,v in self.emitters.items(): d[k] = serialize(v)
-        for k,v in self.media.items():    d[k] = serialize(v)
-        for k,v in self.assets.items():   d[k] = serialize(v)
+            d |= {f"sensor_{i}": _s(s) for i, s in enumerate(self.sensors)}
+        # one pass over all named children
+        d |= {k: _s(v) for k, v in chain(self.shapes.items(), self.emitters.items(),
+                                         self.media.items(), self.assets.items())}
         if self.id is not None: d["id"]=self.id
         return d
 
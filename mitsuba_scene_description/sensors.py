@@ -1,11 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional, Any, Dict, List, Union
-from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform
+from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform, _serialize
 
 # Category: Sensors
 
-@dataclass
+@dataclass(slots=True)
 class OrthographicCamera(Plugin):
     """Orthographic camera (orthographic)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_sensors.html#orthographic
@@ -19,22 +19,46 @@ and far_clip=1e4 (i.e. 10000 ))
         - srf (spectrum):  Sensor Response Function that defines the spectral sensitivity of the sensor (Default: none )
         - film (film): Film plugin for the sensor
     """
+    type: str = field(default="orthographic", init=False)
     to_world: Optional[Transform] = None
     near_clip: Optional[float] = None
     far_clip: Optional[float] = None
     srf: Optional[Union[List[float], Plugin]] = None
     film: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, to_world: Optional[Transform] = None, near_clip: Optional[float] = None, far_clip: Optional[float] = None, srf: Optional[Union[List[float], Plugin]] = None, film: Optional[Plugin] = None):
-        super().__init__(type="orthographic", id=id)
-        self.id = id
-        self.to_world = to_world
-        self.near_clip = near_clip
-        self.far_clip = far_clip
-        self.srf = srf
-        self.film = film
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not OrthographicCamera:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "orthographic"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.near_clip
+        if v is not None:
+            d["near_clip"] = _s(v)
+        v = self.far_clip
+        if v is not None:
+            d["far_clip"] = _s(v)
+        v = self.srf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"srf_{i}"] = _s(item)
+            else:
+                d["srf"] = _s(v)
+        v = self.film
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"film_{i}"] = _s(item)
+            else:
+                d["film"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class PerspectivePinholeCamera(Plugin):
     """Perspective pinhole camera (perspective)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_sensors.html#perspective
@@ -62,6 +86,7 @@ and far_clip=1e4 (i.e. 10000 ))
         - x_fov (float): [P | ∂ | D] Denotes the camera’s field of view in degrees along the horizontal axis.
         - film (film): Film plugin for the sensor
     """
+    type: str = field(default="perspective", init=False)
     to_world: Optional[Transform] = None
     fov: Optional[float] = None
     focal_length: Optional[str] = None
@@ -74,22 +99,57 @@ and far_clip=1e4 (i.e. 10000 ))
     x_fov: Optional[float] = None
     film: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, to_world: Optional[Transform] = None, fov: Optional[float] = None, focal_length: Optional[str] = None, fov_axis: Optional[str] = None, near_clip: Optional[float] = None, far_clip: Optional[float] = None, principal_point_offset_x: Optional[float] = None, principal_point_offset_y: Optional[float] = None, srf: Optional[Union[List[float], Plugin]] = None, x_fov: Optional[float] = None, film: Optional[Plugin] = None):
-        super().__init__(type="perspective", id=id)
-        self.id = id
-        self.to_world = to_world
-        self.fov = fov
-        self.focal_length = focal_length
-        self.fov_axis = fov_axis
-        self.near_clip = near_clip
-        self.far_clip = far_clip
-        self.principal_point_offset_x = principal_point_offset_x
-        self.principal_point_offset_y = principal_point_offset_y
-        self.srf = srf
-        self.x_fov = x_fov
-        self.film = film
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not PerspectivePinholeCamera:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "perspective"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.fov
+        if v is not None:
+            d["fov"] = _s(v)
+        v = self.focal_length
+        if v is not None:
+            d["focal_length"] = _s(v)
+        v = self.fov_axis
+        if v is not None:
+            d["fov_axis"] = _s(v)
+        v = self.near_clip
+        if v is not None:
+            d["near_clip"] = _s(v)
+        v = self.far_clip
+        if v is not None:
+            d["far_clip"] = _s(v)
+        v = self.principal_point_offset_x
+        if v is not None:
+            d["principal_point_offset_x"] = _s(v)
+        v = self.principal_point_offset_y
+        if v is not None:
+            d["principal_point_offset_y"] = _s(v)
+        v = self.srf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"srf_{i}"] = _s(item)
+            else:
+                d["srf"] = _s(v)
+        v = self.x_fov
+        if v is not None:
+            d["x_fov"] = _s(v)
+        v = self.film
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"film_{i}"] = _s(item)
+            else:
+                d["film"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class PerspectiveCameraWithAThinLens(Plugin):
     """Perspective camera with a thin lens (thinlens)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_sensors.html#thinlens
@@ -115,6 +175,7 @@ and far_clip=1e4 (i.e. 10000 ))
         - x_fov (float): [P] Denotes the camera’s field of view in degrees along the horizontal axis.
         - film (film): Film plugin for the sensor
     """
+    type: str = field(default="thinlens", init=False)
     to_world: Optional[Transform] = None
     aperture_radius: Optional[float] = None
     focus_distance: Optional[float] = None
@@ -127,22 +188,57 @@ and far_clip=1e4 (i.e. 10000 ))
     x_fov: Optional[float] = None
     film: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, to_world: Optional[Transform] = None, aperture_radius: Optional[float] = None, focus_distance: Optional[float] = None, focal_length: Optional[str] = None, fov: Optional[float] = None, fov_axis: Optional[str] = None, near_clip: Optional[float] = None, far_clip: Optional[float] = None, srf: Optional[Union[List[float], Plugin]] = None, x_fov: Optional[float] = None, film: Optional[Plugin] = None):
-        super().__init__(type="thinlens", id=id)
-        self.id = id
-        self.to_world = to_world
-        self.aperture_radius = aperture_radius
-        self.focus_distance = focus_distance
-        self.focal_length = focal_length
-        self.fov = fov
-        self.fov_axis = fov_axis
-        self.near_clip = near_clip
-        self.far_clip = far_clip
-        self.srf = srf
-        self.x_fov = x_fov
-        self.film = film
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not PerspectiveCameraWithAThinLens:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "thinlens"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.aperture_radius
+        if v is not None:
+            d["aperture_radius"] = _s(v)
+        v = self.focus_distance
+        if v is not None:
+            d["focus_distance"] = _s(v)
+        v = self.focal_length
+        if v is not None:
+            d["focal_length"] = _s(v)
+        v = self.fov
+        if v is not None:
+            d["fov"] = _s(v)
+        v = self.fov_axis
+        if v is not None:
+            d["fov_axis"] = _s(v)
+        v = self.near_clip
+        if v is not None:
+            d["near_clip"] = _s(v)
+        v = self.far_clip
+        if v is not None:
+            d["far_clip"] = _s(v)
+        v = self.srf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"srf_{i}"] = _s(item)
+            else:
+                d["srf"] = _s(v)
+        v = self.x_fov
+        if v is not None:
+            d["x_fov"] = _s(v)
+        v = self.film
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"film_{i}"] = _s(item)
+            else:
+                d["film"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class DistantRadiancemeterSensor(Plugin):
     """Distant radiancemeter sensor (distant)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_sensors.html#distant
@@ -159,22 +255,54 @@ surface.
         - srf (spectrum):  Sensor Response Function that defines the spectral sensitivity of the sensor (Default: none )
         - film (film): Film plugin for the sensor
     """
+    type: str = field(default="distant", init=False)
     to_world: Optional[Transform] = None
     direction: Optional[Plugin] = None
     target: Optional[Plugin] = None
     srf: Optional[Union[List[float], Plugin]] = None
     film: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, to_world: Optional[Transform] = None, direction: Optional[Plugin] = None, target: Optional[Plugin] = None, srf: Optional[Union[List[float], Plugin]] = None, film: Optional[Plugin] = None):
-        super().__init__(type="distant", id=id)
-        self.id = id
-        self.to_world = to_world
-        self.direction = direction
-        self.target = target
-        self.srf = srf
-        self.film = film
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not DistantRadiancemeterSensor:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "distant"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.direction
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"direction_{i}"] = _s(item)
+            else:
+                d["direction"] = _s(v)
+        v = self.target
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"target_{i}"] = _s(item)
+            else:
+                d["target"] = _s(v)
+        v = self.srf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"srf_{i}"] = _s(item)
+            else:
+                d["srf"] = _s(v)
+        v = self.film
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"film_{i}"] = _s(item)
+            else:
+                d["film"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class BatchSensor(Plugin):
     """Batch sensor (batch)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_sensors.html#batch
@@ -182,16 +310,34 @@ class BatchSensor(Plugin):
         - srf (spectrum):  Sensor Response Function that defines the spectral sensitivity of the sensor (Default: none )
         - film (film): Film plugin for the sensor
     """
+    type: str = field(default="batch", init=False)
     srf: Optional[Union[List[float], Plugin]] = None
     film: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, srf: Optional[Union[List[float], Plugin]] = None, film: Optional[Plugin] = None):
-        super().__init__(type="batch", id=id)
-        self.id = id
-        self.srf = srf
-        self.film = film
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not BatchSensor:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "batch"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.srf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"srf_{i}"] = _s(item)
+            else:
+                d["srf"] = _s(v)
+        v = self.film
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"film_{i}"] = _s(item)
+            else:
+                d["film"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class RadianceMeter(Plugin):
     """Radiance meter (radiancemeter)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_sensors.html#radiancemeter
@@ -205,22 +351,54 @@ sensor is pointing in world coordinates. Must be used with origin .
         - srf (spectrum):  Sensor Response Function that defines the spectral sensitivity of the sensor (Default: none )
         - film (film): Film plugin for the sensor
     """
+    type: str = field(default="radiancemeter", init=False)
     to_world: Optional[Transform] = None
     origin: Optional[Plugin] = None
     direction: Optional[Plugin] = None
     srf: Optional[Union[List[float], Plugin]] = None
     film: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, to_world: Optional[Transform] = None, origin: Optional[Plugin] = None, direction: Optional[Plugin] = None, srf: Optional[Union[List[float], Plugin]] = None, film: Optional[Plugin] = None):
-        super().__init__(type="radiancemeter", id=id)
-        self.id = id
-        self.to_world = to_world
-        self.origin = origin
-        self.direction = direction
-        self.srf = srf
-        self.film = film
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not RadianceMeter:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "radiancemeter"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.origin
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"origin_{i}"] = _s(item)
+            else:
+                d["origin"] = _s(v)
+        v = self.direction
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"direction_{i}"] = _s(item)
+            else:
+                d["direction"] = _s(v)
+        v = self.srf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"srf_{i}"] = _s(item)
+            else:
+                d["srf"] = _s(v)
+        v = self.film
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"film_{i}"] = _s(item)
+            else:
+                d["film"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class IrradianceMeter(Plugin):
     """Irradiance meter (irradiancemeter)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_sensors.html#irradiancemeter
@@ -228,11 +406,29 @@ class IrradianceMeter(Plugin):
         - srf (spectrum):  Sensor Response Function that defines the spectral sensitivity of the sensor (Default: none )
         - film (film): Film plugin for the sensor
     """
+    type: str = field(default="irradiancemeter", init=False)
     srf: Optional[Union[List[float], Plugin]] = None
     film: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, srf: Optional[Union[List[float], Plugin]] = None, film: Optional[Plugin] = None):
-        super().__init__(type="irradiancemeter", id=id)
-        self.id = id
-        self.srf = srf
-        self.film = film
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not IrradianceMeter:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "irradiancemeter"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.srf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"srf_{i}"] = _s(item)
+            else:
+                d["srf"] = _s(v)
+        v = self.film
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"film_{i}"] = _s(item)
+            else:
+                d["film"] = _s(v)
+        return d
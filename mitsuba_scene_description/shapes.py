@@ -1,11 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional, Any, Dict, List, Union
-from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform
+from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform, _serialize
 
 # Category: Shapes
 
-@dataclass
+@dataclass(slots=True)
 class WavefrontObjMeshLoader(Plugin):
     """Wavefront OBJ mesh loader (obj)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_shapes.html#obj
@@ -28,6 +28,7 @@ the normals point outside)
         - (Mesh attribute) (float[]): [P | ∂] Mesh attribute buffer (flatten)
         - bsdf (bsdf): [P] Surface scattering model
     """
+    type: str = field(default="obj", init=False)
     filename: Optional[str] = None
     face_normals: Optional[bool] = None
     flip_tex_coords: Optional[bool] = None
@@ -42,24 +43,63 @@ the normals point outside)
     mesh_attribute: Optional[float] = None
     bsdf: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, filename: Optional[str] = None, face_normals: Optional[bool] = None, flip_tex_coords: Optional[bool] = None, flip_normals: Optional[bool] = None, to_world: Optional[Transform] = None, vertex_count: Optional[int] = None, face_count: Optional[int] = None, faces: Optional[Plugin] = None, vertex_positions: Optional[float] = None, vertex_normals: Optional[float] = None, vertex_texcoords: Optional[float] = None, mesh_attribute: Optional[float] = None, bsdf: Optional[Plugin] = None):
-        super().__init__(type="obj", id=id)
-        self.id = id
-        self.filename = filename
-        self.face_normals = face_normals
-        self.flip_tex_coords = flip_tex_coords
-        self.flip_normals = flip_normals
-        self.to_world = to_world
-        self.vertex_count = vertex_count
-        self.face_count = face_count
-        self.faces = faces
-        self.vertex_positions = vertex_positions
-        self.vertex_normals = vertex_normals
-        self.vertex_texcoords = vertex_texcoords
-        self.mesh_attribute = mesh_attribute
-        self.bsdf = bsdf
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not WavefrontObjMeshLoader:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "obj"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.filename
+        if v is not None:
+            d["filename"] = _s(v)
+        v = self.face_normals
+        if v is not None:
+            d["face_normals"] = _s(v)
+        v = self.flip_tex_coords
+        if v is not None:
+            d["flip_tex_coords"] = _s(v)
+        v = self.flip_normals
+        if v is not None:
+            d["flip_normals"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.vertex_count
+        if v is not None:
+            d["vertex_count"] = _s(v)
+        v = self.face_count
+        if v is not None:
+            d["face_count"] = _s(v)
+        v = self.faces
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"faces_{i}"] = _s(item)
+            else:
+                d["faces"] = _s(v)
+        v = self.vertex_positions
+        if v is not None:
+            d["vertex_positions"] = _s(v)
+        v = self.vertex_normals
+        if v is not None:
+            d["vertex_normals"] = _s(v)
+        v = self.vertex_texcoords
+        if v is not None:
+            d["vertex_texcoords"] = _s(v)
+        v = self.mesh_attribute
+        if v is not None:
+            d["mesh_attribute"] = _s(v)
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class Ply(Plugin):
     """PLY (ply)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_shapes.html#ply
@@ -82,6 +122,7 @@ the normals point outside)
         - (Mesh attribute) (float[]): [P | ∂] Mesh attribute buffer (flatten)
         - bsdf (bsdf): [P] Surface scattering model
     """
+    type: str = field(default="ply", init=False)
     filename: Optional[str] = None
     face_normals: Optional[bool] = None
     flip_tex_coords: Optional[bool] = None
@@ -96,24 +137,63 @@ the normals point outside)
     mesh_attribute: Optional[float] = None
     bsdf: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, filename: Optional[str] = None, face_normals: Optional[bool] = None, flip_tex_coords: Optional[bool] = None, flip_normals: Optional[bool] = None, to_world: Optional[Transform] = None, vertex_count: Optional[int] = None, face_count: Optional[int] = None, faces: Optional[Plugin] = None, vertex_positions: Optional[float] = None, vertex_normals: Optional[float] = None, vertex_texcoords: Optional[float] = None, mesh_attribute: Optional[float] = None, bsdf: Optional[Plugin] = None):
-        super().__init__(type="ply", id=id)
-        self.id = id
-        self.filename = filename
-        self.face_normals = face_normals
-        self.flip_tex_coords = flip_tex_coords
-        self.flip_normals = flip_normals
-        self.to_world = to_world
-        self.vertex_count = vertex_count
-        self.face_count = face_count
-        self.faces = faces
-        self.vertex_positions = vertex_positions
-        self.vertex_normals = vertex_normals
-        self.vertex_texcoords = vertex_texcoords
-        self.mesh_attribute = mesh_attribute
-        self.bsdf = bsdf
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not Ply:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "ply"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.filename
+        if v is not None:
+            d["filename"] = _s(v)
+        v = self.face_normals
+        if v is not None:
+            d["face_normals"] = _s(v)
+        v = self.flip_tex_coords
+        if v is not None:
+            d["flip_tex_coords"] = _s(v)
+        v = self.flip_normals
+        if v is not None:
+            d["flip_normals"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.vertex_count
+        if v is not None:
+            d["vertex_count"] = _s(v)
+        v = self.face_count
+        if v is not None:
+            d["face_count"] = _s(v)
+        v = self.faces
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"faces_{i}"] = _s(item)
+            else:
+                d["faces"] = _s(v)
+        v = self.vertex_positions
+        if v is not None:
+            d["vertex_positions"] = _s(v)
+        v = self.vertex_normals
+        if v is not None:
+            d["vertex_normals"] = _s(v)
+        v = self.vertex_texcoords
+        if v is not None:
+            d["vertex_texcoords"] = _s(v)
+        v = self.mesh_attribute
+        if v is not None:
+            d["mesh_attribute"] = _s(v)
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class SerializedMeshLoader(Plugin):
     """Serialized mesh loader (serialized)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_shapes.html#serialized
@@ -137,6 +217,7 @@ the normals point outside)
         - (Mesh attribute) (float[]): [P | ∂] Mesh attribute buffer (flatten)
         - bsdf (bsdf): [P] Surface scattering model
     """
+    type: str = field(default="serialized", init=False)
     filename: Optional[str] = None
     shape_index: Optional[int] = None
     face_normals: Optional[bool] = None
@@ -151,24 +232,63 @@ the normals point outside)
     mesh_attribute: Optional[float] = None
     bsdf: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, filename: Optional[str] = None, shape_index: Optional[int] = None, face_normals: Optional[bool] = None, flip_normals: Optional[bool] = None, to_world: Optional[Transform] = None, vertex_count: Optional[int] = None, face_count: Optional[int] = None, faces: Optional[Plugin] = None, vertex_positions: Optional[float] = None, vertex_normals: Optional[float] = None, vertex_texcoords: Optional[float] = None, mesh_attribute: Optional[float] = None, bsdf: Optional[Plugin] = None):
-        super().__init__(type="serialized", id=id)
-        self.id = id
-        self.filename = filename
-        self.shape_index = shape_index
-        self.face_normals = face_normals
-        self.flip_normals = flip_normals
-        self.to_world = to_world
-        self.vertex_count = vertex_count
-        self.face_count = face_count
-        self.faces = faces
-        self.vertex_positions = vertex_positions
-        self.vertex_normals = vertex_normals
-        self.vertex_texcoords = vertex_texcoords
-        self.mesh_attribute = mesh_attribute
-        self.bsdf = bsdf
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not SerializedMeshLoader:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "serialized"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.filename
+        if v is not None:
+            d["filename"] = _s(v)
+        v = self.shape_index
+        if v is not None:
+            d["shape_index"] = _s(v)
+        v = self.face_normals
+        if v is not None:
+            d["face_normals"] = _s(v)
+        v = self.flip_normals
+        if v is not None:
+            d["flip_normals"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.vertex_count
+        if v is not None:
+            d["vertex_count"] = _s(v)
+        v = self.face_count
+        if v is not None:
+            d["face_count"] = _s(v)
+        v = self.faces
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"faces_{i}"] = _s(item)
+            else:
+                d["faces"] = _s(v)
+        v = self.vertex_positions
+        if v is not None:
+            d["vertex_positions"] = _s(v)
+        v = self.vertex_normals
+        if v is not None:
+            d["vertex_normals"] = _s(v)
+        v = self.vertex_texcoords
+        if v is not None:
+            d["vertex_texcoords"] = _s(v)
+        v = self.mesh_attribute
+        if v is not None:
+            d["mesh_attribute"] = _s(v)
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class Cube(Plugin):
     """Cube (cube)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_shapes.html#cube
@@ -186,6 +306,7 @@ the normals point outside)
         - (Mesh attribute) (float[]): [P | ∂] Mesh attribute buffer (flatten)
         - bsdf (bsdf): [P] Surface scattering model
     """
+    type: str = field(default="cube", init=False)
     flip_normals: Optional[bool] = None
     to_world: Optional[Transform] = None
     vertex_count: Optional[int] = None
@@ -197,21 +318,54 @@ the normals point outside)
     mesh_attribute: Optional[float] = None
     bsdf: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, flip_normals: Optional[bool] = None, to_world: Optional[Transform] = None, vertex_count: Optional[int] = None, face_count: Optional[int] = None, faces: Optional[Plugin] = None, vertex_positions: Optional[float] = None, vertex_normals: Optional[float] = None, vertex_texcoords: Optional[float] = None, mesh_attribute: Optional[float] = None, bsdf: Optional[Plugin] = None):
-        super().__init__(type="cube", id=id)
-        self.id = id
-        self.flip_normals = flip_normals
-        self.to_world = to_world
-        self.vertex_count = vertex_count
-        self.face_count = face_count
-        self.faces = faces
-        self.vertex_positions = vertex_positions
-        self.vertex_normals = vertex_normals
-        self.vertex_texcoords = vertex_texcoords
-        self.mesh_attribute = mesh_attribute
-        self.bsdf = bsdf
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not Cube:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "cube"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.flip_normals
+        if v is not None:
+            d["flip_normals"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.vertex_count
+        if v is not None:
+            d["vertex_count"] = _s(v)
+        v = self.face_count
+        if v is not None:
+            d["face_count"] = _s(v)
+        v = self.faces
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"faces_{i}"] = _s(item)
+            else:
+                d["faces"] = _s(v)
+        v = self.vertex_positions
+        if v is not None:
+            d["vertex_positions"] = _s(v)
+        v = self.vertex_normals
+        if v is not None:
+            d["vertex_normals"] = _s(v)
+        v = self.vertex_texcoords
+        if v is not None:
+            d["vertex_texcoords"] = _s(v)
+        v = self.mesh_attribute
+        if v is not None:
+            d["mesh_attribute"] = _s(v)
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class Sphere(Plugin):
     """Sphere (sphere)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_shapes.html#sphere
@@ -226,6 +380,7 @@ Note that non-uniform scales and shears are not permitted!
         - silhouette_sampling_weight (float): [P] Weight associated with this shape when sampling silhoeuttes in the scene. (Default: 1)
         - bsdf (bsdf): [P] Surface scattering model
     """
+    type: str = field(default="sphere", init=False)
     center: Optional[Plugin] = None
     radius: Optional[float] = None
     flip_normals: Optional[bool] = None
@@ -233,17 +388,42 @@ Note that non-uniform scales and shears are not permitted!
     silhouette_sampling_weight: Optional[float] = None
     bsdf: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, center: Optional[Plugin] = None, radius: Optional[float] = None, flip_normals: Optional[bool] = None, to_world: Optional[Transform] = None, silhouette_sampling_weight: Optional[float] = None, bsdf: Optional[Plugin] = None):
-        super().__init__(type="sphere", id=id)
-        self.id = id
-        self.center = center
-        self.radius = radius
-        self.flip_normals = flip_normals
-        self.to_world = to_world
-        self.silhouette_sampling_weight = silhouette_sampling_weight
-        self.bsdf = bsdf
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not Sphere:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "sphere"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.center
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"center_{i}"] = _s(item)
+            else:
+                d["center"] = _s(v)
+        v = self.radius
+        if v is not None:
+            d["radius"] = _s(v)
+        v = self.flip_normals
+        if v is not None:
+            d["flip_normals"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.silhouette_sampling_weight
+        if v is not None:
+            d["silhouette_sampling_weight"] = _s(v)
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class Rectangle(Plugin):
     """Rectangle (rectangle)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_shapes.html#rectangle
@@ -253,20 +433,38 @@ class Rectangle(Plugin):
         - silhouette_sampling_weight (float): [P] Weight associated with this shape when sampling silhoeuttes in the scene. (Default: 1)
         - bsdf (bsdf): [P] Surface scattering model
     """
+    type: str = field(default="rectangle", init=False)
     flip_normals: Optional[bool] = None
     to_world: Optional[Transform] = None
     silhouette_sampling_weight: Optional[float] = None
     bsdf: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, flip_normals: Optional[bool] = None, to_world: Optional[Transform] = None, silhouette_sampling_weight: Optional[float] = None, bsdf: Optional[Plugin] = None):
-        super().__init__(type="rectangle", id=id)
-        self.id = id
-        self.flip_normals = flip_normals
-        self.to_world = to_world
-        self.silhouette_sampling_weight = silhouette_sampling_weight
-        self.bsdf = bsdf
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not Rectangle:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "rectangle"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.flip_normals
+        if v is not None:
+            d["flip_normals"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.silhouette_sampling_weight
+        if v is not None:
+            d["silhouette_sampling_weight"] = _s(v)
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class Disk(Plugin):
     """Disk (disk)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_shapes.html#disk
@@ -277,20 +475,38 @@ permitted! (Default: none, i.e. object space = world space)
         - silhouette_sampling_weight (float): [P] Weight associated with this shape when sampling silhoeuttes in the scene. (Default: 1)
         - bsdf (bsdf): [P] Surface scattering model
     """
+    type: str = field(default="disk", init=False)
     flip_normals: Optional[bool] = None
     to_world: Optional[Transform] = None
     silhouette_sampling_weight: Optional[float] = None
     bsdf: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, flip_normals: Optional[bool] = None, to_world: Optional[Transform] = None, silhouette_sampling_weight: Optional[float] = None, bsdf: Optional[Plugin] = None):
-        super().__init__(type="disk", id=id)
-        self.id = id
-        self.flip_normals = flip_normals
-        self.to_world = to_world
-        self.silhouette_sampling_weight = silhouette_sampling_weight
-        self.bsdf = bsdf
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not Disk:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "disk"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.flip_normals
+        if v is not None:
+            d["flip_normals"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.silhouette_sampling_weight
+        if v is not None:
+            d["silhouette_sampling_weight"] = _s(v)
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class Cylinder(Plugin):
     """Cylinder (cylinder)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_shapes.html#cylinder
@@ -306,6 +522,7 @@ not permitted! (Default: none, i.e. object space = world space)
         - silhouette_sampling_weight (float): [P] Weight associated with this shape when sampling silhoeuttes in the scene. (Default: 1)
         - bsdf (bsdf): [P] Surface scattering model
     """
+    type: str = field(default="cylinder", init=False)
     p0: Optional[Plugin] = None
     p1: Optional[Plugin] = None
     radius: Optional[float] = None
@@ -314,18 +531,49 @@ not permitted! (Default: none, i.e. object space = world space)
     silhouette_sampling_weight: Optional[float] = None
     bsdf: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, p0: Optional[Plugin] = None, p1: Optional[Plugin] = None, radius: Optional[float] = None, flip_normals: Optional[bool] = None, to_world: Optional[Transform] = None, silhouette_sampling_weight: Optional[float] = None, bsdf: Optional[Plugin] = None):
-        super().__init__(type="cylinder", id=id)
-        self.id = id
-        self.p0 = p0
-        self.p1 = p1
-        self.radius = radius
-        self.flip_normals = flip_normals
-        self.to_world = to_world
-        self.silhouette_sampling_weight = silhouette_sampling_weight
-        self.bsdf = bsdf
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not Cylinder:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "cylinder"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.p0
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"p0_{i}"] = _s(item)
+            else:
+                d["p0"] = _s(v)
+        v = self.p1
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"p1_{i}"] = _s(item)
+            else:
+                d["p1"] = _s(v)
+        v = self.radius
+        if v is not None:
+            d["radius"] = _s(v)
+        v = self.flip_normals
+        if v is not None:
+            d["flip_normals"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.silhouette_sampling_weight
+        if v is not None:
+            d["silhouette_sampling_weight"] = _s(v)
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class BSplineCurve(Plugin):
     """B-spline curve (bsplinecurve)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_shapes.html#bsplinecurve
@@ -340,6 +588,7 @@ points’ raddii are invariant to this transformation!
 Each control point in the buffer is structured as follows: position_x, position_y, position_z, radius
         - bsdf (bsdf): [P] Surface scattering model
     """
+    type: str = field(default="bsplinecurve", init=False)
     filename: Optional[str] = None
     to_world: Optional[Transform] = None
     silhouette_sampling_weight: Optional[float] = None
@@ -348,18 +597,45 @@ Each control point in the buffer is structured as follows: position_x, position_
     control_points: Optional[float] = None
     bsdf: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, filename: Optional[str] = None, to_world: Optional[Transform] = None, silhouette_sampling_weight: Optional[float] = None, control_point_count: Optional[int] = None, segment_indices: Optional[Plugin] = None, control_points: Optional[float] = None, bsdf: Optional[Plugin] = None):
-        super().__init__(type="bsplinecurve", id=id)
-        self.id = id
-        self.filename = filename
-        self.to_world = to_world
-        self.silhouette_sampling_weight = silhouette_sampling_weight
-        self.control_point_count = control_point_count
-        self.segment_indices = segment_indices
-        self.control_points = control_points
-        self.bsdf = bsdf
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not BSplineCurve:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "bsplinecurve"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.filename
+        if v is not None:
+            d["filename"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.silhouette_sampling_weight
+        if v is not None:
+            d["silhouette_sampling_weight"] = _s(v)
+        v = self.control_point_count
+        if v is not None:
+            d["control_point_count"] = _s(v)
+        v = self.segment_indices
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"segment_indices_{i}"] = _s(item)
+            else:
+                d["segment_indices"] = _s(v)
+        v = self.control_points
+        if v is not None:
+            d["control_points"] = _s(v)
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class LinearCurve(Plugin):
     """Linear curve (linearcurve)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_shapes.html#linearcurve
@@ -373,6 +649,7 @@ points’ raddii are invariant to this transformation!
 Each control point in the buffer is structured as follows: position_x, position_y, position_z, radius
         - bsdf (bsdf): [P] Surface scattering model
     """
+    type: str = field(default="linearcurve", init=False)
     filename: Optional[str] = None
     to_world: Optional[Transform] = None
     control_point_count: Optional[int] = None
@@ -380,17 +657,42 @@ Each control point in the buffer is structured as follows: position_x, position_
     control_points: Optional[float] = None
     bsdf: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, filename: Optional[str] = None, to_world: Optional[Transform] = None, control_point_count: Optional[int] = None, segment_indices: Optional[Plugin] = None, control_points: Optional[float] = None, bsdf: Optional[Plugin] = None):
-        super().__init__(type="linearcurve", id=id)
-        self.id = id
-        self.filename = filename
-        self.to_world = to_world
-        self.control_point_count = control_point_count
-        self.segment_indices = segment_indices
-        self.control_points = control_points
-        self.bsdf = bsdf
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not LinearCurve:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "linearcurve"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.filename
+        if v is not None:
+            d["filename"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.control_point_count
+        if v is not None:
+            d["control_point_count"] = _s(v)
+        v = self.segment_indices
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"segment_indices_{i}"] = _s(item)
+            else:
+                d["segment_indices"] = _s(v)
+        v = self.control_points
+        if v is not None:
+            d["control_points"] = _s(v)
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class SdfGrid(Plugin):
     """SDF Grid (sdfgrid)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_shapes.html#sdfgrid
@@ -405,22 +707,46 @@ specified in the XML scene description.
         - to_world (transform): [P | ∂ | D] Specifies a linear object-to-world transformation. (Default: none (i.e. object space = world space))
         - bsdf (bsdf): [P] Surface scattering model
     """
+    type: str = field(default="sdfgrid", init=False)
     filename: Optional[str] = None
     grid: Optional[Plugin] = None
     normals: Optional[str] = None
     to_world: Optional[Transform] = None
     bsdf: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, filename: Optional[str] = None, grid: Optional[Plugin] = None, normals: Optional[str] = None, to_world: Optional[Transform] = None, bsdf: Optional[Plugin] = None):
-        super().__init__(type="sdfgrid", id=id)
-        self.id = id
-        self.filename = filename
-        self.grid = grid
-        self.normals = normals
-        self.to_world = to_world
-        self.bsdf = bsdf
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not SdfGrid:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "sdfgrid"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.filename
+        if v is not None:
+            d["filename"] = _s(v)
+        v = self.grid
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"grid_{i}"] = _s(item)
+            else:
+                d["grid"] = _s(v)
+        v = self.normals
+        if v is not None:
+            d["normals"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class ShapeGroup(Plugin):
     """Shape group (shapegroup)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_shapes.html#shapegroup
@@ -428,16 +754,34 @@ class ShapeGroup(Plugin):
         - (Nested plugin) (shape):  One or more shapes that should be made available for geometry instancing
         - bsdf (bsdf): [P] Surface scattering model
     """
+    type: str = field(default="shapegroup", init=False)
     shape: Optional[Union[Plugin, List[Plugin]]] = None
     bsdf: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, shape: Optional[Union[Plugin, List[Plugin]]] = None, bsdf: Optional[Plugin] = None):
-        super().__init__(type="shapegroup", id=id)
-        self.id = id
-        self.shape = shape
-        self.bsdf = bsdf
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not ShapeGroup:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "shapegroup"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.shape
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"shape_{i}"] = _s(item)
+            else:
+                d["shape"] = _s(v)
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class Instance(Plugin):
     """Instance (instance)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_shapes.html#instance
@@ -446,18 +790,38 @@ class Instance(Plugin):
         - to_world (transform): [P | ∂ | D] Specifies a linear object-to-world transformation. (Default: none (i.e. object space = world space))
         - bsdf (bsdf): [P] Surface scattering model
     """
+    type: str = field(default="instance", init=False)
     shapegroup: Optional[Union[Plugin, List[Plugin]]] = None
     to_world: Optional[Transform] = None
     bsdf: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, shapegroup: Optional[Union[Plugin, List[Plugin]]] = None, to_world: Optional[Transform] = None, bsdf: Optional[Plugin] = None):
-        super().__init__(type="instance", id=id)
-        self.id = id
-        self.shapegroup = shapegroup
-        self.to_world = to_world
-        self.bsdf = bsdf
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not Instance:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "instance"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.shapegroup
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"shapegroup_{i}"] = _s(item)
+            else:
+                d["shapegroup"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class Ellipsoids(Plugin):
     """Ellipsoids (ellipsoids)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_shapes.html#ellipsoids
@@ -486,6 +850,7 @@ an opacity value for each ellipsoids, or a set of spherical harmonic coefficient
 as used in the volprim_rf_basic integrator.
         - bsdf (bsdf): [P] Surface scattering model
     """
+    type: str = field(default="ellipsoids", init=False)
     filename: Optional[str] = None
     data: Optional[Plugin] = None
     centers: Optional[Plugin] = None
@@ -498,22 +863,73 @@ as used in the volprim_rf_basic integrator.
     tensor: Optional[Union[Plugin, List[Plugin]]] = None
     bsdf: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, filename: Optional[str] = None, data: Optional[Plugin] = None, centers: Optional[Plugin] = None, scales: Optional[Plugin] = None, quaternions: Optional[Plugin] = None, scale_factor: Optional[float] = None, extent: Optional[float] = None, extent_adaptive_clamping: Optional[float] = None, to_world: Optional[Transform] = None, tensor: Optional[Union[Plugin, List[Plugin]]] = None, bsdf: Optional[Plugin] = None):
-        super().__init__(type="ellipsoids", id=id)
-        self.id = id
-        self.filename = filename
-        self.data = data
-        self.centers = centers
-        self.scales = scales
-        self.quaternions = quaternions
-        self.scale_factor = scale_factor
-        self.extent = extent
-        self.extent_adaptive_clamping = extent_adaptive_clamping
-        self.to_world = to_world
-        self.tensor = tensor
-        self.bsdf = bsdf
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not Ellipsoids:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "ellipsoids"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.filename
+        if v is not None:
+            d["filename"] = _s(v)
+        v = self.data
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"data_{i}"] = _s(item)
+            else:
+                d["data"] = _s(v)
+        v = self.centers
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"centers_{i}"] = _s(item)
+            else:
+                d["centers"] = _s(v)
+        v = self.scales
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"scales_{i}"] = _s(item)
+            else:
+                d["scales"] = _s(v)
+        v = self.quaternions
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"quaternions_{i}"] = _s(item)
+            else:
+                d["quaternions"] = _s(v)
+        v = self.scale_factor
+        if v is not None:
+            d["scale_factor"] = _s(v)
+        v = self.extent
+        if v is not None:
+            d["extent"] = _s(v)
+        v = self.extent_adaptive_clamping
+        if v is not None:
+            d["extent_adaptive_clamping"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.tensor
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"tensor_{i}"] = _s(item)
+            else:
+                d["tensor"] = _s(v)
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class MeshEllipsoids(Plugin):
     """Mesh ellipsoids (ellipsoidsmesh)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_shapes.html#ellipsoidsmesh
@@ -542,6 +958,7 @@ an opacity value for each ellipsoids, or a set of spherical harmonic coefficient
 as used in the volprim_rf_basic integrator.
         - bsdf (bsdf): [P] Surface scattering model
     """
+    type: str = field(default="ellipsoidsmesh", init=False)
     filename: Optional[str] = None
     data: Optional[Plugin] = None
     centers: Optional[Plugin] = None
@@ -555,18 +972,71 @@ as used in the volprim_rf_basic integrator.
     tensor: Optional[Union[Plugin, List[Plugin]]] = None
     bsdf: Optional[Plugin] = None
 
-    def __init__(self, id: Optional[str] = None, filename: Optional[str] = None, data: Optional[Plugin] = None, centers: Optional[Plugin] = None, scales: Optional[Plugin] = None, quaternions: Optional[Plugin] = None, scale_factor: Optional[float] = None, extent: Optional[float] = None, extent_adaptive_clamping: Optional[float] = None, shell: Optional[str] = None, to_world: Optional[Transform] = None, tensor: Optional[Union[Plugin, List[Plugin]]] = None, bsdf: Optional[Plugin] = None):
-        super().__init__(type="ellipsoidsmesh", id=id)
-        self.id = id
-        self.filename = filename
-        self.data = data
-        self.centers = centers
-        self.scales = scales
-        self.quaternions = quaternions
-        self.scale_factor = scale_factor
-        self.extent = extent
-        self.extent_adaptive_clamping = extent_adaptive_clamping
-        self.shell = shell
-        self.to_world = to_world
-        self.tensor = tensor
-        self.bsdf = bsdf
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not MeshEllipsoids:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "ellipsoidsmesh"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.filename
+        if v is not None:
+            d["filename"] = _s(v)
+        v = self.data
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"data_{i}"] = _s(item)
+            else:
+                d["data"] = _s(v)
+        v = self.centers
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"centers_{i}"] = _s(item)
+            else:
+                d["centers"] = _s(v)
+        v = self.scales
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"scales_{i}"] = _s(item)
+            else:
+                d["scales"] = _s(v)
+        v = self.quaternions
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"quaternions_{i}"] = _s(item)
+            else:
+                d["quaternions"] = _s(v)
+        v = self.scale_factor
+        if v is not None:
+            d["scale_factor"] = _s(v)
+        v = self.extent
+        if v is not None:
+            d["extent"] = _s(v)
+        v = self.extent_adaptive_clamping
+        if v is not None:
+            d["extent_adaptive_clamping"] = _s(v)
+        v = self.shell
+        if v is not None:
+            d["shell"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.tensor
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"tensor_{i}"] = _s(item)
+            else:
+                d["tensor"] = _s(v)
+        v = self.bsdf
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bsdf_{i}"] = _s(item)
+            else:
+                d["bsdf"] = _s(v)
+        return d
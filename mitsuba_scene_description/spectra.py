@@ -1,11 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional, Any, Dict, List, Union
-from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform
+from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform, _serialize
 
 # Category: Spectra
 
-@dataclass
+@dataclass(slots=True)
 class UniformSpectrum(Plugin):
     """Uniform spectrum (uniform)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_spectra.html#uniform
@@ -14,18 +14,30 @@ class UniformSpectrum(Plugin):
         - wavelength_max (float):  Upper bound of the wavelength sampling range in nanometers. Default: 830 nm
         - value (float): [P | ∂] Value of the spectral function across the specified spectral range.
     """
+    type: str = field(default="uniform", init=False)
     wavelength_min: Optional[float] = None
     wavelength_max: Optional[float] = None
     value: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, wavelength_min: Optional[float] = None, wavelength_max: Optional[float] = None, value: Optional[float] = None):
-        super().__init__(type="uniform", id=id)
-        self.id = id
-        self.wavelength_min = wavelength_min
-        self.wavelength_max = wavelength_max
-        self.value = value
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not UniformSpectrum:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "uniform"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.wavelength_min
+        if v is not None:
+            d["wavelength_min"] = _s(v)
+        v = self.wavelength_max
+        if v is not None:
+            d["wavelength_max"] = _s(v)
+        v = self.value
+        if v is not None:
+            d["value"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class RegularSpectrum(Plugin):
     """Regular spectrum (regular)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_spectra.html#regular
@@ -35,20 +47,34 @@ class RegularSpectrum(Plugin):
         - values (string): [P | ∂] Values of the spectral function at spectral range extremities.
         - range (string): [P | ∂] Spectral emission range.
     """
+    type: str = field(default="regular", init=False)
     wavelength_min: Optional[float] = None
     wavelength_max: Optional[float] = None
     values: Optional[str] = None
     range: Optional[str] = None
 
-    def __init__(self, id: Optional[str] = None, wavelength_min: Optional[float] = None, wavelength_max: Optional[float] = None, values: Optional[str] = None, range: Optional[str] = None):
-        super().__init__(type="regular", id=id)
-        self.id = id
-        self.wavelength_min = wavelength_min
-        self.wavelength_max = wavelength_max
-        self.values = values
-        self.range = range
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not RegularSpectrum:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "regular"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.wavelength_min
+        if v is not None:
+            d["wavelength_min"] = _s(v)
+        v = self.wavelength_max
+        if v is not None:
+            d["wavelength_max"] = _s(v)
+        v = self.values
+        if v is not None:
+            d["values"] = _s(v)
+        v = self.range
+        if v is not None:
+            d["range"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class IrregularSpectrum(Plugin):
     """Irregular spectrum (irregular)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_spectra.html#irregular
@@ -56,16 +82,26 @@ class IrregularSpectrum(Plugin):
         - wavelengths (string): [P | ∂] Wavelength values where the function is defined.
         - values (string): [P | ∂] Values of the spectral function at the specified wavelengths.
     """
+    type: str = field(default="irregular", init=False)
     wavelengths: Optional[str] = None
     values: Optional[str] = None
 
-    def __init__(self, id: Optional[str] = None, wavelengths: Optional[str] = None, values: Optional[str] = None):
-        super().__init__(type="irregular", id=id)
-        self.id = id
-        self.wavelengths = wavelengths
-        self.values = values
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not IrregularSpectrum:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "irregular"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.wavelengths
+        if v is not None:
+            d["wavelengths"] = _s(v)
+        v = self.values
+        if v is not None:
+            d["values"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class SrgbSpectrum(Plugin):
     """sRGB spectrum (srgb)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_spectra.html#srgb
@@ -73,16 +109,26 @@ class SrgbSpectrum(Plugin):
         - color (color):  The corresponding sRGB color value.
         - value (color): [P | ∂] Spectral upsampling model coefficients of the srgb color value.
     """
+    type: str = field(default="srgb", init=False)
     color: Optional[List[float]] = None
     value: Optional[List[float]] = None
 
-    def __init__(self, id: Optional[str] = None, color: Optional[List[float]] = None, value: Optional[List[float]] = None):
-        super().__init__(type="srgb", id=id)
-        self.id = id
-        self.color = color
-        self.value = value
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not SrgbSpectrum:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "srgb"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.color
+        if v is not None:
+            d["color"] = _s(v)
+        v = self.value
+        if v is not None:
+            d["value"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class D65Spectrum(Plugin):
     """D65 spectrum (d65)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_spectra.html#d65
@@ -91,32 +137,56 @@ class D65Spectrum(Plugin):
         - scale (float):  Optional scaling factor applied to the emitted spectrum. (Default: 1.0)
         - (Nested plugin) (texture): [P | ∂] Underlying texture/spectra to be multiplied by D65.
     """
+    type: str = field(default="d65", init=False)
     color: Optional[List[float]] = None
     scale: Optional[float] = None
     texture: Optional[Union[Plugin, List[Plugin]]] = None
 
-    def __init__(self, id: Optional[str] = None, color: Optional[List[float]] = None, scale: Optional[float] = None, texture: Optional[Union[Plugin, List[Plugin]]] = None):
-        super().__init__(type="d65", id=id)
-        self.id = id
-        self.color = color
-        self.scale = scale
-        self.texture = texture
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not D65Spectrum:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "d65"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.color
+        if v is not None:
+            d["color"] = _s(v)
+        v = self.scale
+        if v is not None:
+            d["scale"] = _s(v)
+        v = self.texture
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"texture_{i}"] = _s(item)
+            else:
+                d["texture"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class RawConstantValuedTexture(Plugin):
     """Raw constant-valued texture (rawconstant)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_spectra.html#rawconstant
     Params:
         - value (float or vector): [P | ∂] The constant value(s) to be returned. Can be a single float or a 3D vector.
     """
+    type: str = field(default="rawconstant", init=False)
     value: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, value: Optional[float] = None):
-        super().__init__(type="rawconstant", id=id)
-        self.id = id
-        self.value = value
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not RawConstantValuedTexture:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "rawconstant"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.value
+        if v is not None:
+            d["value"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class BlackbodySpectrum(Plugin):
     """Blackbody spectrum (blackbody)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_spectra.html#blackbody
@@ -125,13 +195,25 @@ class BlackbodySpectrum(Plugin):
         - wavelength_max (float):  Maximum wavelength of the spectral range in nanometers. (Default: 830nm)
         - temperature (float): [P] Black body temperature in Kelvins.
     """
+    type: str = field(default="blackbody", init=False)
     wavelength_min: Optional[float] = None
     wavelength_max: Optional[float] = None
     temperature: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, wavelength_min: Optional[float] = None, wavelength_max: Optional[float] = None, temperature: Optional[float] = None):
-        super().__init__(type="blackbody", id=id)
-        self.id = id
-        self.wavelength_min = wavelength_min
-        self.wavelength_max = wavelength_max
-        self.temperature = temperature
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not BlackbodySpectrum:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "blackbody"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.wavelength_min
+        if v is not None:
+            d["wavelength_min"] = _s(v)
+        v = self.wavelength_max
+        if v is not None:
+            d["wavelength_max"] = _s(v)
+        v = self.temperature
+        if v is not None:
+            d["temperature"] = _s(v)
+        return d
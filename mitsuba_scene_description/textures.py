@@ -1,11 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional, Any, Dict, List, Union
-from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform
+from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform, _serialize
 
 # Category: Textures
 
-@dataclass
+@dataclass(slots=True)
 class BitmapTexture(Plugin):
     """Bitmap texture (bitmap)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_textures.html#bitmap
@@ -34,6 +34,7 @@ column are ignored.
 cause small differences as hardware interpolation methods typically have a
 loss of precision (not exactly 32-bit arithmetic). (Default: true)
     """
+    type: str = field(default="bitmap", init=False)
     filename: Optional[str] = None
     bitmap: Optional[Plugin] = None
     data: Optional[Plugin] = None
@@ -44,20 +45,51 @@ loss of precision (not exactly 32-bit arithmetic). (Default: true)
     to_uv: Optional[Transform] = None
     accel: Optional[bool] = None
 
-    def __init__(self, id: Optional[str] = None, filename: Optional[str] = None, bitmap: Optional[Plugin] = None, data: Optional[Plugin] = None, filter_type: Optional[str] = None, wrap_mode: Optional[str] = None, format: Optional[str] = None, raw: Optional[bool] = None, to_uv: Optional[Transform] = None, accel: Optional[bool] = None):
-        super().__init__(type="bitmap", id=id)
-        self.id = id
-        self.filename = filename
-        self.bitmap = bitmap
-        self.data = data
-        self.filter_type = filter_type
-        self.wrap_mode = wrap_mode
-        self.format = format
-        self.raw = raw
-        self.to_uv = to_uv
-        self.accel = accel
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not BitmapTexture:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "bitmap"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.filename
+        if v is not None:
+            d["filename"] = _s(v)
+        v = self.bitmap
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"bitmap_{i}"] = _s(item)
+            else:
+                d["bitmap"] = _s(v)
+        v = self.data
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"data_{i}"] = _s(item)
+            else:
+                d["data"] = _s(v)
+        v = self.filter_type
+        if v is not None:
+            d["filter_type"] = _s(v)
+        v = self.wrap_mode
+        if v is not None:
+            d["wrap_mode"] = _s(v)
+        v = self.format
+        if v is not None:
+            d["format"] = _s(v)
+        v = self.raw
+        if v is not None:
+            d["raw"] = _s(v)
+        v = self.to_uv
+        if v is not None:
+            d["to_uv"] = _s(v)
+        v = self.accel
+        if v is not None:
+            d["accel"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class CheckerboardTexture(Plugin):
     """Checkerboard texture (checkerboard)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_textures.html#checkerboard
@@ -67,18 +99,38 @@ class CheckerboardTexture(Plugin):
         - to_uv (transform): [P] Specifies an optional 3x3 UV transformation matrix. A 4x4 matrix can also be provided.
 In that case, the last row and columns will be ignored.  (Default: none)
     """
+    type: str = field(default="checkerboard", init=False)
     color0: Optional[Union[List[float], Plugin]] = None
     color1: Optional[Union[List[float], Plugin]] = None
     to_uv: Optional[Transform] = None
 
-    def __init__(self, id: Optional[str] = None, color0: Optional[Union[List[float], Plugin]] = None, color1: Optional[Union[List[float], Plugin]] = None, to_uv: Optional[Transform] = None):
-        super().__init__(type="checkerboard", id=id)
-        self.id = id
-        self.color0 = color0
-        self.color1 = color1
-        self.to_uv = to_uv
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not CheckerboardTexture:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "checkerboard"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.color0
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"color0_{i}"] = _s(item)
+            else:
+                d["color0"] = _s(v)
+        v = self.color1
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"color1_{i}"] = _s(item)
+            else:
+                d["color1"] = _s(v)
+        v = self.to_uv
+        if v is not None:
+            d["to_uv"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class MeshAttributeTexture(Plugin):
     """Mesh attribute texture (mesh_attribute)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_textures.html#mesh_attribute
@@ -87,25 +139,43 @@ class MeshAttributeTexture(Plugin):
         - scale (float): [P] Scaling factor applied to the interpolated attribute value during evaluation.
 (Default: 1.0)
     """
+    type: str = field(default="mesh_attribute", init=False)
     name: Optional[str] = None
     scale: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, name: Optional[str] = None, scale: Optional[float] = None):
-        super().__init__(type="mesh_attribute", id=id)
-        self.id = id
-        self.name = name
-        self.scale = scale
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not MeshAttributeTexture:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "mesh_attribute"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.name
+        if v is not None:
+            d["name"] = _s(v)
+        v = self.scale
+        if v is not None:
+            d["scale"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class VolumetricTexture(Plugin):
     """Volumetric texture (volume)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_textures.html#volume
     Params:
         - volume (float , spectrum or volume): [P | ∂] Volumetric texture (Default: 0.75).
     """
+    type: str = field(default="volume", init=False)
     volume: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, volume: Optional[float] = None):
-        super().__init__(type="volume", id=id)
-        self.id = id
-        self.volume = volume
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not VolumetricTexture:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "volume"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.volume
+        if v is not None:
+            d["volume"] = _s(v)
+        return d
@@ -1,94 +1,252 @@
 from __future__ import annotations
 from dataclasses import dataclass, field, fields, is_dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-@dataclass
+# Per-class field names (minus ``type``/``id``), filled lazily by ``_field_names``.
+# ``__init_subclass__`` fires before ``@dataclass`` has collected the fields,
+# so the names are resolved on first serialization instead.
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+def _field_names(cls: type) -> Tuple[str, ...]:
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(
+            f.name for f in fields(cls) if f.name not in ("type", "id")
+        )
+    return names
+
+@dataclass(slots=True)
 class Plugin:
     type: str
     id: Optional[str] = None
     def to_dict(self) -> Dict[str, Any]:
+        try:
+            return self._to_dict()
+        except RecursionError:
+            # too deep (or cyclic) for the recursive path
+            return _serialize_stack(self, _PLUGIN)
+    def _to_dict(self, _s: Any = None) -> Dict[str, Any]:
+        """Own entries, with values passed through *_s* (``_serialize`` by default).
+
+        Overrides must pass every value through *_s*: with ``_keep`` they return
+        the unconverted entries that ``_serialize_stack`` expands.
+        """
+        if _s is None:
+            _s = _serialize
+        _get = getattr
         out: Dict[str, Any] = {"type": self.type}
         if self.id is not None:
             out["id"] = self.id
-        for f in fields(self):
-            if f.name in ("type", "id"):
-                continue
-            v = getattr(self, f.name)
+        for name in _field_names(type(self)):
+            v = _get(self, name)
             if v is None:
                 continue
             if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
                 for i, item in enumerate(v):
-                    out[f"{f.name}_{i}"] = serialize(item)
+                    out[f"{name}_{i}"] = _s(item)
                 continue
-            out[f.name] = serialize(v)
+            out[name] = _s(v)
         return out
 
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# How a value is serialized, decided once per type by ``_kind``
+_LEAF, _PLUGIN, _CALL_TO_DICT, _TRANSFORM, _DATACLASS, _DICT, _LIST = range(7)
+_KINDS: Dict[type, int] = {t: _LEAF for t in _ATOMIC_TYPES}
+
+def _kind(t: type) -> int:
+    if issubclass(t, Plugin):
+        # subclasses overriding to_dict are taken as-is
+        k = _PLUGIN if t.to_dict is Plugin.to_dict else _CALL_TO_DICT
+    elif issubclass(t, Transform):
+        k = _TRANSFORM
+    elif t.__name__.endswith("Transform4f"):  # already a Mitsuba Transform
+        k = _LEAF
+    elif is_dataclass(t):
+        k = _CALL_TO_DICT if hasattr(t, "to_dict") else _DATACLASS
+    elif issubclass(t, dict):
+        k = _DICT
+    elif issubclass(t, list):
+        k = _LIST
+    else:
+        k = _LEAF
+    _KINDS[t] = k
+    return k
+
 def serialize(obj: Any) -> Any:
-    if isinstance(obj, Transform):
-        return obj.to_mi()
-    # already a Mitsuba Transform?
+    """Convert *obj* into the plain structure expected by ``mi.load_dict``.
+
+    Recursive; a scene nested past the recursion limit is redone with an
+    explicit work stack, and a cyclic one raises ``ValueError``.
+    """
     try:
-        if obj.__class__.__name__.endswith("Transform4f"):
-            return obj
-    except Exception:
-        pass
-    if is_dataclass(obj):
-        return obj.to_dict() if hasattr(obj, "to_dict") else {
-            k: serialize(getattr(obj, k)) for k in obj.__dataclass_fields__  # type: ignore
-        }
-    if isinstance(obj, dict):
-        return {k: serialize(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [serialize(v) for v in obj]
-    return obj
-
-@dataclass
+        return _serialize(obj)
+    except RecursionError:
+        return _serialize_stack(obj, _kind(type(obj)))
+
+def _serialize(obj: Any) -> Any:
+    k = _KINDS.get(type(obj))
+    if k is None:
+        k = _kind(type(obj))
+    if k == _LEAF:
+        return obj
+    if k == _PLUGIN:
+        return obj._to_dict()
+    if k == _TRANSFORM:
+        return obj.to_mi()
+    if k == _CALL_TO_DICT:
+        return obj.to_dict()
+    _s = _serialize
+    if k == _DICT:
+        return {key: _s(v) for key, v in obj.items()}
+    if k == _LIST:
+        return [_s(v) for v in obj]
+    return {f: _s(getattr(obj, f)) for f in obj.__dataclass_fields__}  # type: ignore
+
+def _keep(v: Any) -> Any:
+    return v
+
+_EXIT = -1  # work item that takes a container off the current path
+
+def _serialize_stack(obj: Any, k: int) -> Any:
+    """``_serialize`` with an explicit work stack instead of recursion.
+
+    Items are ``(parent, key, value, kind)``; the result is stored in
+    ``parent[key]``. Containers on the current path are tracked by ``id`` so
+    that a cycle raises ``ValueError``; shared subtrees are expanded per use.
+    """
+    kinds = _KINDS
+    root: List[Any] = [obj]
+    stack: List[Tuple[Any, Any, Any, int]] = [(root, 0, obj, k)]
+    pop, push = stack.pop, stack.append
+    path: set = set()
+    while stack:
+        parent, key, v, k = pop()
+        if k == _EXIT:
+            path.discard(key)
+            continue
+        if k == _TRANSFORM:
+            parent[key] = v.to_mi()
+            continue
+        if k == _CALL_TO_DICT:
+            parent[key] = v.to_dict()
+            continue
+        if id(v) in path:
+            raise ValueError(f"cannot serialize cyclic reference to {type(v).__name__}")
+        if k == _PLUGIN:
+            out = v._to_dict(_keep)
+            items = out.items()
+        elif k == _DICT:
+            out = dict(v)
+            items = out.items()
+        elif k == _LIST:
+            out = list(v)
+            items = enumerate(out)
+        else:  # _DATACLASS without to_dict
+            out = {f: getattr(v, f) for f in v.__dataclass_fields__}  # type: ignore
+            items = out.items()
+        # place the copy now; entries that need converting are replaced when popped
+        parent[key] = out
+        path.add(id(v))
+        push((None, id(v), None, _EXIT))
+        for ck, c in items:
+            k = kinds.get(type(c))
+            if k is None:
+                k = _kind(type(c))
+            if k != _LEAF:
+                push((out, ck, c, k))
+    return root[0]
+
+@dataclass(slots=True)
 class RGB(Plugin):
     value: List[float] = field(default_factory=lambda: [1.0, 1.0, 1.0])
     def __init__(self, value: List[float]):
-        super().__init__(type="rgb")
+        Plugin.__init__(self, type="rgb")
         self.value = value
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        d: Dict[str, Any] = {"type": "rgb"}
+        if self.id is not None:
+            d["id"] = self.id
+        if self.value is not None:
+            d["value"] = _s(self.value)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class Ref(Plugin):
     def __init__(self, id: str):
-        super().__init__(type="ref")
+        Plugin.__init__(self, type="ref")
         self.id = id
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        d: Dict[str, Any] = {"type": "ref"}
+        if self.id is not None:
+            d["id"] = self.id
+        return d
+
+# ``mitsuba`` is optional at import time; resolved once on first ``to_mi()``
+_mi: Any = None
+
+def _mitsuba() -> Any:
+    global _mi
+    if _mi is None:
+        import mitsuba
+        _mi = mitsuba
+    return _mi
+
+# Transform steps are tuples ``(op_tag, *args)``; the tag indexes the builder table.
+# Sequence arguments are copied, so editing the caller's lists cannot make a cached result stale.
+_OP_TRANSLATE, _OP_SCALE, _OP_ROTATE, _OP_LOOK_AT, _OP_MATRIX = range(5)
+
+# builders for a single step, indexed by op tag; ``T`` is the Mitsuba transform type
+_TRANSFORM_OPS = (
+    lambda T, s: T().translate([s[1], s[2], s[3]]),
+    lambda T, s: T().scale([s[1], s[2], s[3]]),
+    lambda T, s: T().rotate(axis=[s[1], s[2], s[3]], angle=s[4]),
+    lambda T, s: T().look_at(origin=list(s[1]), target=list(s[2]), up=list(s[3])),
+    lambda T, s: T([list(r) for r in s[1]]),
+)
+
+def _compose(T: Any, steps: List[Tuple[Any, ...]], ops: Tuple[Any, ...]) -> Any:
+    cur = T()
+    for step in steps:
+        cur = ops[step[0]](T, step) @ cur
+    return cur
 
 class Transform:
     """Chainable affine transform builder (translate, scale, rotate, look_at).
 
-    Produces a ``mi.ScalarTransform4f``.
+    Produces a ``mi.ScalarTransform4f``. The composed result is cached until
+    the next builder call.
     """
-    __slots__ = ("_ops",)
+    __slots__ = ("_ops", "_cached")
     def __init__(self) -> None:
-        self._ops: List[Dict[str, Any]] = []
+        self._ops: List[Tuple[Any, ...]] = []
+        self._cached: Any = None
+    def _push(self, step: Tuple[Any, ...]) -> None:
+        self._ops.append(step)
+        self._cached = None
     def translate(self, x: float, y: float, z: float) -> "Transform":
-        self._ops.append({"op":"translate","value":[x,y,z]}); return self
+        self._push((_OP_TRANSLATE, x, y, z)); return self
     def scale(self, x: float, y: Optional[float] = None, z: Optional[float] = None) -> "Transform":
-        if y is None and z is None: self._ops.append({"op":"scale","value":[x,x,x]})
-        else: self._ops.append({"op":"scale","value":[x,y,z]})
+        if y is None and z is None: self._push((_OP_SCALE, x, x, x))
+        else: self._push((_OP_SCALE, x, y, z))
         return self
     def rotate(self, ax: float, ay: float, az: float, angle: float) -> "Transform":
-        self._ops.append({"op":"rotate","axis":[ax,ay,az],"angle":angle}); return self
+        self._push((_OP_ROTATE, ax, ay, az, angle)); return self
     def look_at(self, origin: List[float], target: List[float], up: List[float] = [0,1,0]) -> "Transform":
-        self._ops.append({"op":"look_at","origin":origin,"target":target,"up":up}); return self
+        self._push((_OP_LOOK_AT, tuple(origin), tuple(target), tuple(up))); return self
     def matrix(self, m4x4: List[List[float]]) -> "Transform":
-        self._ops.append({"op":"matrix","matrix":m4x4}); return self
+        self._push((_OP_MATRIX, tuple(map(tuple, m4x4)))); return self
     def to_mi(self):
-        import mitsuba as mi
-        T = mi.ScalarTransform4f
-        cur = T()
-        for step in self._ops:
-            op = step["op"]
-            if op == "translate": piece = T().translate(step["value"])
-            elif op == "scale": piece = T().scale(step["value"])
-            elif op == "rotate": piece = T().rotate(axis=step["axis"], angle=step["angle"])
-            elif op == "look_at": piece = T().look_at(origin=step["origin"], target=step["target"], up=step["up"])
-            elif op == "matrix": piece = T(step["matrix"])
-            else: continue
-            cur = piece @ cur
-        return cur
+        if self._cached is None:
+            self._cached = _compose(_mitsuba().ScalarTransform4f, self._ops, _TRANSFORM_OPS)
+        return self._cached
+
+_OP_PERSPECTIVE, _OP_ORTHOGRAPHIC = range(len(_TRANSFORM_OPS), len(_TRANSFORM_OPS) + 2)
+
+_PROJECTIVE_OPS = _TRANSFORM_OPS + (
+    lambda T, s: T().perspective(fov=s[1], near=s[2], far=s[3]),
+    lambda T, s: T().orthographic(near=s[1], far=s[2]),
+)
 
 class ProjectiveTransform(Transform):
     """Chainable projective transform builder (Mitsuba >= 3.7).
@@ -96,24 +254,12 @@ class ProjectiveTransform(Transform):
     Extends :class:`Transform` with ``perspective()`` and ``orthographic()``.
     Produces a ``mi.ScalarProjectiveTransform4f``.
     """
-    __slots__ = ("_ops",)
+    __slots__ = ()
     def perspective(self, fov: float, near: float, far: float) -> "ProjectiveTransform":
-        self._ops.append({"op":"perspective","fov":fov,"near":near,"far":far}); return self
+        self._push((_OP_PERSPECTIVE, fov, near, far)); return self
     def orthographic(self, near: float, far: float) -> "ProjectiveTransform":
-        self._ops.append({"op":"orthographic","near":near,"far":far}); return self
+        self._push((_OP_ORTHOGRAPHIC, near, far)); return self
     def to_mi(self):
-        import mitsuba as mi
-        T = mi.ScalarProjectiveTransform4f
-        cur = T()
-        for step in self._ops:
-            op = step["op"]
-            if op == "translate": piece = T().translate(step["value"])
-            elif op == "scale": piece = T().scale(step["value"])
-            elif op == "rotate": piece = T().rotate(axis=step["axis"], angle=step["angle"])
-            elif op == "look_at": piece = T().look_at(origin=step["origin"], target=step["target"], up=step["up"])
-            elif op == "perspective": piece = T().perspective(fov=step["fov"], near=step["near"], far=step["far"])
-            elif op == "orthographic": piece = T().orthographic(near=step["near"], far=step["far"])
-            elif op == "matrix": piece = T(step["matrix"])
-            else: continue
-            cur = piece @ cur
-        return cur
+        if self._cached is None:
+            self._cached = _compose(_mitsuba().ScalarProjectiveTransform4f, self._ops, _PROJECTIVE_OPS)
+        return self._cached
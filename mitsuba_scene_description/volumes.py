@@ -1,11 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional, Any, Dict, List, Union
-from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform
+from .utils import Plugin, RGB, Ref, Transform, ProjectiveTransform, _serialize
 
 # Category: Volumes
 
-@dataclass
+@dataclass(slots=True)
 class GridBasedVolumeDataSource(Plugin):
     """Grid-based volume data source (gridvolume)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_volumes.html#gridvolume
@@ -35,6 +35,7 @@ to be set to true (Default: false)
 cause small differences as hardware interpolation methods typically have a
 loss of precision (not exactly 32-bit arithmetic). (Default: true)
     """
+    type: str = field(default="gridvolume", init=False)
     filename: Optional[str] = None
     grid: Optional[Plugin] = None
     use_grid_bbox: Optional[bool] = None
@@ -45,29 +46,68 @@ loss of precision (not exactly 32-bit arithmetic). (Default: true)
     to_world: Optional[Transform] = None
     accel: Optional[bool] = None
 
-    def __init__(self, id: Optional[str] = None, filename: Optional[str] = None, grid: Optional[Plugin] = None, use_grid_bbox: Optional[bool] = None, data: Optional[Plugin] = None, filter_type: Optional[str] = None, wrap_mode: Optional[str] = None, raw: Optional[bool] = None, to_world: Optional[Transform] = None, accel: Optional[bool] = None):
-        super().__init__(type="gridvolume", id=id)
-        self.id = id
-        self.filename = filename
-        self.grid = grid
-        self.use_grid_bbox = use_grid_bbox
-        self.data = data
-        self.filter_type = filter_type
-        self.wrap_mode = wrap_mode
-        self.raw = raw
-        self.to_world = to_world
-        self.accel = accel
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not GridBasedVolumeDataSource:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "gridvolume"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.filename
+        if v is not None:
+            d["filename"] = _s(v)
+        v = self.grid
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"grid_{i}"] = _s(item)
+            else:
+                d["grid"] = _s(v)
+        v = self.use_grid_bbox
+        if v is not None:
+            d["use_grid_bbox"] = _s(v)
+        v = self.data
+        if v is not None:
+            if isinstance(v, list) and v and hasattr(v[0], 'to_dict'):
+                for i, item in enumerate(v):
+                    d[f"data_{i}"] = _s(item)
+            else:
+                d["data"] = _s(v)
+        v = self.filter_type
+        if v is not None:
+            d["filter_type"] = _s(v)
+        v = self.wrap_mode
+        if v is not None:
+            d["wrap_mode"] = _s(v)
+        v = self.raw
+        if v is not None:
+            d["raw"] = _s(v)
+        v = self.to_world
+        if v is not None:
+            d["to_world"] = _s(v)
+        v = self.accel
+        if v is not None:
+            d["accel"] = _s(v)
+        return d
 
-@dataclass
+@dataclass(slots=True)
 class ConstantValuedVolumeDataSource(Plugin):
     """Constant-valued volume data source (constvolume)
     https://mitsuba.readthedocs.io/en/v3.7.1/src/generated/plugins_volumes.html#constvolume
     Params:
         - value (float or spectrum): [P | ∂] Specifies the value of the constant volume.
     """
+    type: str = field(default="constvolume", init=False)
     value: Optional[float] = None
 
-    def __init__(self, id: Optional[str] = None, value: Optional[float] = None):
-        super().__init__(type="constvolume", id=id)
-        self.id = id
-        self.value = value
+    def _to_dict(self, _s: Any = _serialize) -> Dict[str, Any]:
+        if type(self) is not ConstantValuedVolumeDataSource:
+            # subclasses may add fields; take the generic path
+            return Plugin._to_dict(self, _s)
+        d: Dict[str, Any] = {"type": "constvolume"}
+        if self.id is not None:
+            d["id"] = self.id
+        v = self.value
+        if v is not None:
+            d["value"] = _s(v)
+        return d
@@ -0,0 +1,186 @@
+import types
+import unittest
+from dataclasses import dataclass
+from unittest import mock
+
+import mitsuba_scene_description as msd
+from mitsuba_scene_description import utils
+
+
+class Extended(msd.Plugin):
+    def to_dict(self):
+        d = super().to_dict()
+        d["extra"] = 1
+        return d
+
+
+@dataclass(slots=True)
+class ExtendedSphere(msd.Sphere):
+    foo: int = 1
+
+
+class PluginOverrideTest(unittest.TestCase):
+    def test_override_calling_base_to_dict(self):
+        self.assertEqual(Extended(type="foo").to_dict(), {"type": "foo", "extra": 1})
+
+    def test_override_nested_in_scene(self):
+        scene = msd.Scene(shapes={"x": Extended(type="foo")})
+        self.assertEqual(
+            scene.to_dict(), {"type": "scene", "x": {"type": "foo", "extra": 1}}
+        )
+
+    def test_subclass_fields_of_generated_class(self):
+        sphere = ExtendedSphere(radius=2.0, foo=5)
+        expected = {"type": "sphere", "radius": 2.0, "foo": 5}
+        self.assertEqual(sphere.to_dict(), expected)
+        self.assertEqual(msd.Scene(shapes={"x": sphere}).to_dict()["x"], expected)
+
+
+class SerializeTest(unittest.TestCase):
+    def test_raw_dict_children(self):
+        scene = msd.Scene(shapes={"x": {"type": "sphere", "bsdf": msd.RGB([1, 1, 1])}})
+        self.assertEqual(
+            scene.to_dict(),
+            {
+                "type": "scene",
+                "x": {"type": "sphere", "bsdf": {"type": "rgb", "value": [1, 1, 1]}},
+            },
+        )
+
+    def test_plugin_list_expands_on_plugin_field(self):
+        sphere = msd.Sphere(bsdf=[msd.Ref("a"), msd.Ref("b")], center=[0, 1, 2])
+        self.assertEqual(
+            sphere.to_dict(),
+            {
+                "type": "sphere",
+                "center": [0, 1, 2],
+                "bsdf_0": {"type": "ref", "id": "a"},
+                "bsdf_1": {"type": "ref", "id": "b"},
+            },
+        )
+
+    def test_deep_nesting(self):
+        plugin = msd.RGB([0.5, 0.5, 0.5])
+        for _ in range(5000):
+            plugin = msd.SmoothDiffuseMaterial(reflectance=plugin)
+        d = msd.serialize(plugin)
+        for _ in range(5000):
+            d = d["reflectance"]
+        self.assertEqual(d, {"type": "rgb", "value": [0.5, 0.5, 0.5]})
+
+    def test_deep_nesting_via_to_dict(self):
+        plugin = msd.RGB([0.5, 0.5, 0.5])
+        for _ in range(5000):
+            plugin = msd.SmoothDiffuseMaterial(reflectance=plugin)
+        d = msd.Scene(shapes={"x": msd.Sphere(bsdf=plugin)}).to_dict()["x"]["bsdf"]
+        for _ in range(5000):
+            d = d["reflectance"]
+        self.assertEqual(d, {"type": "rgb", "value": [0.5, 0.5, 0.5]})
+
+    def test_cycle_raises(self):
+        material = msd.SmoothDiffuseMaterial()
+        material.reflectance = material
+        with self.assertRaises(ValueError):
+            msd.serialize(material)
+        with self.assertRaises(ValueError):
+            msd.Scene(shapes={"x": msd.Sphere(bsdf=material)}).to_dict()
+        values = []
+        values.append(values)
+        with self.assertRaises(ValueError):
+            msd.serialize(values)
+
+    def test_shared_subtree(self):
+        rgb = msd.RGB([0.5, 0.5, 0.5])
+        material = msd.SmoothDiffuseMaterial(reflectance=rgb)
+        expected = {"type": "diffuse", "reflectance": {"type": "rgb", "value": [0.5, 0.5, 0.5]}}
+        self.assertEqual(
+            msd.serialize([material, {"a": material, "b": [rgb, material]}]),
+            [expected, {"a": expected, "b": [expected["reflectance"], expected]}],
+        )
+        # shared subtree under a chain too deep for the recursive path
+        plugin = material
+        for _ in range(5000):
+            plugin = msd.BlendedMaterial(bsdf=[plugin, material])
+        d = msd.serialize(plugin)
+        for _ in range(5000):
+            self.assertEqual(d["bsdf_1"], expected)
+            d = d["bsdf_0"]
+        self.assertEqual(d, expected)
+
+
+
+class StubTransform:
+    """Records builder calls in place of a Mitsuba transform type."""
+
+    def __init__(self, matrix=None):
+        self.ops = [] if matrix is None else [("matrix", matrix)]
+
+    def _with(self, *op):
+        self.ops.append(op)
+        return self
+
+    def translate(self, v):
+        return self._with("translate", v)
+
+    def scale(self, v):
+        return self._with("scale", v)
+
+    def rotate(self, axis, angle):
+        return self._with("rotate", axis, angle)
+
+    def look_at(self, origin, target, up):
+        return self._with("look_at", origin, target, up)
+
+    def perspective(self, fov, near, far):
+        return self._with("perspective", fov, near, far)
+
+    def orthographic(self, near, far):
+        return self._with("orthographic", near, far)
+
+    def __matmul__(self, other):
+        out = StubTransform()
+        out.ops = other.ops + self.ops
+        return out
+
+
+STUB_MITSUBA = types.SimpleNamespace(
+    ScalarTransform4f=StubTransform, ScalarProjectiveTransform4f=StubTransform
+)
+
+
+@mock.patch.object(utils, "_mi", STUB_MITSUBA)
+class TransformTest(unittest.TestCase):
+    def test_to_mi_is_cached(self):
+        t = msd.Transform().translate(1, 2, 3)
+        self.assertIs(t.to_mi(), t.to_mi())
+
+    def test_builder_call_invalidates_cache(self):
+        t = msd.Transform()
+        first = t.translate(1, 2, 3).to_mi()
+        second = t.scale(2).to_mi()
+        self.assertIsNot(first, second)
+        self.assertEqual(second.ops, [("translate", [1, 2, 3]), ("scale", [2, 2, 2])])
+
+    def test_projective_builder_call_invalidates_cache(self):
+        t = msd.ProjectiveTransform().translate(0, 0, 1)
+        first = t.to_mi()
+        self.assertIs(t.to_mi(), first)
+        second = t.perspective(45, 0.1, 100).to_mi()
+        self.assertIsNot(first, second)
+        self.assertEqual(
+            second.ops, [("translate", [0, 0, 1]), ("perspective", 45, 0.1, 100)]
+        )
+
+    def test_arguments_are_copied(self):
+        origin, matrix = [0, 0, 1], [[1, 0], [0, 1]]
+        t = msd.Transform().look_at(origin, [0, 0, 0]).matrix(matrix)
+        expected = [("look_at", [0, 0, 1], [0, 0, 0], [0, 1, 0]), ("matrix", [[1, 0], [0, 1]])]
+        origin[2] = 5
+        matrix[0][0] = 2
+        self.assertEqual(t.to_mi().ops, expected)
+        origin[2] = 7
+        self.assertEqual(t.to_mi().ops, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()